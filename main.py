@@ -4,18 +4,1172 @@ from gi.repository import Gtk, Gdk, Gio, GLib, Pango, GdkPixbuf
 import os
 import threading
 import urllib.request
+import http.client
 import json
 import shutil
 import time
 import subprocess
 import configparser
-from urllib.parse import quote
+import codecs
+import gzip
+import io
+import marshal
+import struct
+import zlib
+import hashlib
+import collections
+import itertools
+import queue
+import heapq
+import math
+from array import array
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from urllib.parse import quote, urljoin
 from datetime import datetime
 
+try:
+    import zstandard  # Opcional: habilita catálogos comprimidos com zstd
+except ImportError:
+    zstandard = None
+
 # URL padrão para os dados JSON de AppImage
 DEFAULT_APPS_DATA_URL = "https://raw.githubusercontent.com/appimage-shop/app/refs/heads/main/app.json"
 # URL para o ícone da aplicação
 APP_ICON_URL = "https://raw.githubusercontent.com/appimage-shop/app/refs/heads/main/icon.png"
+# Quantidade de aplicativos entregues à UI por lote durante o download do catálogo
+CATALOG_BATCH_SIZE = 200
+# Cabeçalho do cache binário: assinatura, versão do formato, versão do marshal, CRC32 e tamanho dos dados
+BINARY_CACHE_MAGIC = b"AISC"
+BINARY_CACHE_VERSION = 4
+BINARY_CACHE_HEADER = struct.Struct("<4sHHII")
+# Codificações aceitas no download do catálogo e assinaturas dos formatos comprimidos
+CATALOG_ACCEPT_ENCODING = "zstd, gzip" if zstandard else "gzip"
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Formato do catálogo fragmentado: índice leve com URLs dos fragmentos de detalhes
+CATALOG_INDEX_FORMAT = "appimage-shop-index"
+# Manipulação de instância (RFC 3229) usada para receber apenas as diferenças do catálogo
+CATALOG_DELTA_IM = "appimage-shop-delta"
+# Tokens da busca: sequências de letras e dígitos do texto normalizado
+SEARCH_TOKEN_RE = re.compile(r"\w+")
+# Intervalo de silêncio na digitação antes de filtrar a lista, e duração acima da qual a passada é registrada
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_SLOW_PASS_MS = 50
+# Busca aproximada: resultados exibidos, pesos por campo e fração mínima de trigramas em comum
+SEARCH_TOP_K = 50
+SEARCH_WEIGHT_NAME, SEARCH_WEIGHT_TAGS, SEARCH_WEIGHT_DESCRIPTION = 3, 2, 1
+SEARCH_FUZZY_MIN_SIMILARITY = 0.4
+# Espera após a última mudança nas pastas observadas antes de atualizar a lista de instalados
+INSTALLED_REFRESH_DELAY_MS = 200
+# Prioridades da fila de imagens: página de detalhes, linhas visíveis e linhas ocultas pelos filtros
+IMAGE_PRIORITY_DETAILS, IMAGE_PRIORITY_VISIBLE, IMAGE_PRIORITY_BACKGROUND = 0, 1, 2
+# Tempo limite de cada download de imagem, para que servidores lentos não ocupem o pool indefinidamente
+IMAGE_FETCH_TIMEOUT_S = 15
+# Memória máxima dos ícones e capturas de tela decodificados mantidos em cache
+PIXBUF_CACHE_BYTES = 32 * 1024 * 1024
+# Cache de imagens em disco: ao passar do limite, remove as menos usadas até esta fração dele
+IMAGE_CACHE_LOW_WATERMARK = 0.9
+# Intervalo entre gravações do índice do cache de imagens em disco
+IMAGE_CACHE_SAVE_INTERVAL_S = 30
+# Resolução do último acesso no índice: usos mais próximos que isso não alteram o índice
+IMAGE_CACHE_ATIME_RESOLUTION_S = 3600
+# Tamanhos de exibição de ícones e capturas de tela, e escalas de tela (HiDPI) com versões reduzidas prontas
+ICON_SIZE = (64, 64)
+SCREENSHOT_SIZE = (400, 300)
+IMAGE_SCALES = (1, 2)
+# Sugestões exibidas pelo autocompletar da busca
+COMPLETION_LIMIT = 8
+# Máximo de linhas de aplicativo guardadas para reaproveitamento
+ROW_POOL_SIZE = 200
+# Preenchimento da loja: linhas criadas de imediato e tempo por iteração do laço principal para as demais
+ROW_FIRST_PAGE = 30
+ROW_FRAME_BUDGET_MS = 8
+
+def iter_json_array(stream, batch_size=CATALOG_BATCH_SIZE, chunk_size=65536, sink=None):
+    """Analisa um array JSON à medida que os bytes chegam, gerando lotes de elementos.
+
+    Os bytes lidos são copiados para sink, se informado, sem manter o corpo inteiro em memória.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf, pos, eof, started, after_item, data_seen = "", 0, False, False, False, False
+    batch = []
+    while True:
+        while pos < len(buf) and buf[pos].isspace():
+            pos += 1
+        if pos < len(buf):
+            if not started:
+                if buf[pos] != "[":
+                    raise json.JSONDecodeError("Esperado um array JSON", buf, pos)
+                started, pos = True, pos + 1
+                continue
+            if buf[pos] == "]" and (after_item or not data_seen):
+                break
+            if after_item:
+                if buf[pos] != ",":
+                    raise json.JSONDecodeError("Esperado ',' ou ']'", buf, pos)
+                after_item, pos = False, pos + 1
+                continue
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # Um valor que termina no fim do buffer pode ainda estar incompleto
+            if end is not None and (end < len(buf) or eof):
+                batch.append(item)
+                pos, after_item, data_seen = end, True, True
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                continue
+        if eof:
+            raise json.JSONDecodeError("Array JSON incompleto", buf, pos)
+        chunk = stream.read(chunk_size)
+        if sink is not None and chunk:
+            sink.write(chunk)
+        eof = not chunk
+        buf = buf[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+    if batch:
+        yield batch
+
+# Esquema de um aplicativo do catálogo: campo -> tipo, ou (list, tipo/esquema de cada item)
+APP_SCHEMA = {
+    "required": {
+        "name": str, "description": str, "appimage_url": str, "icon_url": str, "category": str, "app": str,
+        "version": str, "details": str, "license": str, "size": str, "last_updated": str,
+    },
+    "optional": {
+        "screenshots": (list, {"url": str, "caption": str}),
+        "tags": (list, str),
+        "alternative_versions": (list, {"version": str, "appimage_url": str}),
+    },
+}
+# Esquema das entradas do índice de um catálogo fragmentado, suficientes para desenhar a lista
+APP_INDEX_SCHEMA = {
+    "required": {"name": str, "description": str, "icon_url": str, "category": str, "version": str, "size": str},
+    "optional": {"tags": (list, str)},
+}
+
+class ValidationReport:
+    """Resumo da validação de um catálogo: contagem e nomes por tipo de erro."""
+    def __init__(self):
+        self.accepted = 0
+        self.counts = {}
+        self.names = {}
+
+    def add_error(self, error, name):
+        self.counts[error] = self.counts.get(error, 0) + 1
+        self.names.setdefault(error, []).append(name)
+
+    def merge(self, other):
+        self.accepted += other.accepted
+        for error, names in other.names.items():
+            self.counts[error] = self.counts.get(error, 0) + other.counts[error]
+            self.names.setdefault(error, []).extend(names)
+
+    @property
+    def rejected(self):
+        return sum(self.counts.values())
+
+    def summary(self):
+        """Texto legível com os erros encontrados."""
+        lines = [f"{self.accepted} aplicativos aceitos, {self.rejected} rejeitados"]
+        for error, count in sorted(self.counts.items(), key=lambda item: -item[1]):
+            lines.append(f"  {error}: {count} ({', '.join(self.names[error][:5])}{', ...' if count > 5 else ''})")
+        return "\n".join(lines)
+
+class CatalogValidator:
+    """Validador compilado uma única vez a partir de um esquema declarativo."""
+    def __init__(self, schema):
+        self.checks = [self._compile_field(field, spec, True) for field, spec in schema["required"].items()]
+        self.checks += [self._compile_field(field, spec, False) for field, spec in schema.get("optional", {}).items()]
+
+    def _compile_field(self, field, spec, required):
+        """Gera a função que valida um campo; ela retorna a mensagem de erro ou None."""
+        if isinstance(spec, tuple):
+            container, item_spec = spec
+            item_check = self._compile_item(field, item_spec)
+            type_error = f"Campo '{field}' deve ser uma lista"
+
+            def check(app):
+                value = app.get(field)
+                if value is None:
+                    return f"Campo '{field}' ausente" if required else None
+                if not isinstance(value, container):
+                    return type_error
+                for item in value:
+                    error = item_check(item)
+                    if error:
+                        return error
+                return None
+            return check
+
+        type_error = f"Campo '{field}' deve ser uma string" if spec is str else f"Campo '{field}' tem tipo inválido"
+
+        def check(app):
+            value = app.get(field)
+            if value is None:
+                return f"Campo '{field}' ausente" if required else None
+            return None if isinstance(value, spec) else type_error
+        return check
+
+    def _compile_item(self, field, item_spec):
+        """Gera a validação dos itens de um campo de lista."""
+        if isinstance(item_spec, dict):
+            keys = tuple(item_spec.items())
+            error = f"Cada item de '{field}' deve ter {', '.join(repr(key) for key in item_spec)}"
+            return lambda item: None if isinstance(item, dict) and all(isinstance(item.get(key), kind) for key, kind in keys) else error
+        error = f"Itens de '{field}' devem ser do tipo {item_spec.__name__}"
+        return lambda item: None if isinstance(item, item_spec) else error
+
+    def validate_app(self, app):
+        """Valida um aplicativo e retorna a primeira mensagem de erro ou None."""
+        if not isinstance(app, dict):
+            return "Registro deve ser um objeto"
+        for check in self.checks:
+            error = check(app)
+            if error:
+                return error
+        return None
+
+    def validate_batch(self, apps):
+        """Valida um lote e retorna (aplicativos aceitos, relatório)."""
+        accepted, report = [], ValidationReport()
+        for app in apps:
+            error = self.validate_app(app)
+            if error:
+                name = app.get("name") if isinstance(app, dict) else None
+                report.add_error(error, name if isinstance(name, str) else "<sem nome>")
+            else:
+                accepted.append(app)
+        report.accepted = len(accepted)
+        return accepted, report
+
+def open_catalog_stream(response):
+    """Retorna um fluxo descomprimido (com peek) da resposta, pelo Content-Encoding ou pela assinatura do arquivo."""
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    magic = response.peek(4)[:4]
+    if encoding == "gzip" or magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=response)
+    if encoding == "zstd" or magic == ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Catálogo comprimido com zstd, mas o módulo zstandard não está instalado")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(response))
+    return response if hasattr(response, "peek") else io.BufferedReader(response)
+
+def split_catalog(data):
+    """Separa um catálogo em (registros, fragmentos). Catálogos em lista não têm fragmentos."""
+    if isinstance(data, list):
+        return data, None
+    if isinstance(data, dict) and data.get("format") == CATALOG_INDEX_FORMAT and isinstance(data.get("apps"), list):
+        shards = data.get("shards") or {}
+        if not isinstance(shards, dict) or not all(isinstance(key, str) and isinstance(template, str)
+                                                   for key, template in shards.items()):
+            raise ValueError("Fragmentos do índice devem mapear nomes a modelos de URL")
+        return data["apps"], shards
+    raise ValueError("Formato de catálogo desconhecido")
+
+def apply_catalog_delta(base, delta):
+    """Aplica um delta {"upsert": [...], "remove": [...]} ao catálogo base, mantendo a ordem."""
+    if not isinstance(delta, dict) or not isinstance(delta.get("upsert", []), list) or not isinstance(delta.get("remove", []), list):
+        raise ValueError("Formato de delta inválido")
+    upserts = {}
+    for app in delta.get("upsert", []):
+        if not isinstance(app, dict) or not isinstance(app.get("name"), str):
+            raise ValueError("Aplicativo do delta sem nome")
+        upserts[app["name"]] = app
+    if not all(isinstance(name, str) for name in delta.get("remove", [])):
+        raise ValueError("Remoção do delta deve listar nomes de aplicativos")
+    removed = set(delta.get("remove", []))
+    result = []
+    for app in base:
+        name = app.get("name") if isinstance(app, dict) else None
+        if name not in removed:
+            result.append(upserts.pop(name, app))
+    result.extend(upserts.values())
+    return result
+
+def normalize_text(text):
+    """Converte para minúsculas e remove acentos, para comparar textos na busca."""
+    if text.isascii():
+        return text.lower()
+    return "".join(ch for ch in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(ch))
+
+class AppRecord:
+    """Aplicativo do catálogo com campos fixos e textos de busca pré-normalizados."""
+    TEXT_FIELDS = ("name", "description", "appimage_url", "icon_url", "icon", "category", "app", "version",
+                   "details", "license", "size", "last_updated")
+    LIST_FIELDS = ("screenshots", "tags", "alternative_versions")
+    FIELDS = TEXT_FIELDS + LIST_FIELDS
+    __slots__ = FIELDS + ("position", "source", "name_key", "description_key", "tags_key")
+
+    def __init__(self, values, search_keys=None):
+        for field, value in zip(self.FIELDS, values):
+            setattr(self, field, value)
+        self.position = 0  # Posição no catálogo, usada para ordenar as listas
+        self.source = None  # URL da fonte de catálogo de origem
+        if search_keys is None:
+            search_keys = (normalize_text(self.name), normalize_text(self.description),
+                           tuple(normalize_text(tag) for tag in self.tags))
+        self.name_key, self.description_key, self.tags_key = search_keys
+
+    @classmethod
+    def from_dict(cls, app):
+        """Cria um registro a partir de uma entrada validada do JSON."""
+        return cls(tuple(app.get(field, "") for field in cls.TEXT_FIELDS) +
+                   tuple(tuple(app.get(field, ())) for field in cls.LIST_FIELDS))
+
+    def to_tuple(self):
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def search_keys(self):
+        return self.name_key, self.description_key, self.tags_key
+
+    def __eq__(self, other):
+        return isinstance(other, AppRecord) and self.to_tuple() == other.to_tuple()
+
+    def __repr__(self):
+        return f"AppRecord({self.name!r}, {self.version!r})"
+
+def write_binary_cache(path, source_stat, apps, shards):
+    """Grava os registros validados, suas chaves de busca e os fragmentos no cache binário."""
+    payload = marshal.dumps((tuple(source_stat), [(app.to_tuple(), app.search_keys()) for app in apps], shards))
+    header = BINARY_CACHE_HEADER.pack(BINARY_CACHE_MAGIC, BINARY_CACHE_VERSION, marshal.version,
+                                      zlib.crc32(payload), len(payload))
+    partial = f"{path}.{threading.get_ident()}.part"  # Único por thread: duas gravações simultâneas não se misturam
+    try:
+        with open(partial, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(partial, path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+def read_binary_cache(path, source_stat):
+    """Lê o cache binário. Retorna (registros, fragmentos) ou None se for inválido ou antigo."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(BINARY_CACHE_HEADER.size)
+            if len(header) != BINARY_CACHE_HEADER.size:
+                return None
+            magic, version, marshal_version, checksum, length = BINARY_CACHE_HEADER.unpack(header)
+            if (magic, version, marshal_version) != (BINARY_CACHE_MAGIC, BINARY_CACHE_VERSION, marshal.version):
+                return None
+            payload = f.read(length)
+    except IOError:
+        return None
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        return None
+    try:
+        cached_stat, rows, shards = marshal.loads(payload)
+    except (ValueError, EOFError, TypeError):
+        return None
+    # O cache binário só vale para o JSON do qual foi derivado
+    if cached_stat != tuple(source_stat):
+        return None
+    return [AppRecord(values, keys) for values, keys in rows], shards
+
+def diff_catalogs(old_apps, new_apps):
+    """Compara dois catálogos pelo nome e retorna (adicionados, removidos, alterados)."""
+    old_by_name = {app.name: app for app in old_apps}
+    new_by_name = {app.name: app for app in new_apps}
+    added = [app for name, app in new_by_name.items() if name not in old_by_name]
+    removed = [app for name, app in old_by_name.items() if name not in new_by_name]
+    changed = [app for name, app in new_by_name.items() if name in old_by_name and old_by_name[name] != app]
+    return added, removed, changed
+
+class SearchIndex:
+    """Índice invertido dos tokens normalizados de nome, descrição, tags e categoria.
+
+    Cada termo da busca casa com os tokens que começam por ele; o resultado é a interseção
+    das posições dos aplicativos de cada termo. Os conjuntos retornados não devem ser alterados.
+    """
+    PREFIX_CACHE_SIZE = 256
+
+    def __init__(self):
+        self.postings = {}  # Token -> posições dos aplicativos no catálogo
+        self.vocabulary = []  # Tokens ordenados, para achar por bisect os que começam com um prefixo
+        self.vocabulary_sorted = True
+        self.prefix_cache = {}  # Prefixo -> posições, para termos repetidos entre buscas
+        self.last_terms, self.last_result = (), None
+
+    def add(self, apps):
+        """Indexa aplicativos já posicionados no catálogo."""
+        for app in apps:
+            tokens = set(SEARCH_TOKEN_RE.findall(app.name_key))
+            tokens.update(SEARCH_TOKEN_RE.findall(app.description_key))
+            tokens.update(SEARCH_TOKEN_RE.findall(normalize_text(app.category)))
+            for tag in app.tags_key:
+                tokens.update(SEARCH_TOKEN_RE.findall(tag))
+            for token in tokens:
+                positions = self.postings.get(token)
+                if positions is None:
+                    self.postings[token] = positions = []
+                    self.vocabulary.append(token)
+                    self.vocabulary_sorted = False
+                positions.append(app.position)
+        self.prefix_cache.clear()
+        self.last_terms, self.last_result = (), None
+
+    def lookup(self, prefix):
+        """Retorna as posições dos aplicativos com algum token que começa com prefix."""
+        positions = self.prefix_cache.get(prefix)
+        if positions is not None:
+            return positions
+        if not self.vocabulary_sorted:
+            self.vocabulary.sort()
+            self.vocabulary_sorted = True
+        positions = set()
+        for index in range(bisect_left(self.vocabulary, prefix), len(self.vocabulary)):
+            token = self.vocabulary[index]
+            if not token.startswith(prefix):
+                break
+            positions.update(self.postings[token])
+        if len(self.prefix_cache) >= self.PREFIX_CACHE_SIZE:
+            self.prefix_cache.clear()
+        self.prefix_cache[prefix] = positions
+        return positions
+
+    def search(self, query):
+        """Retorna as posições dos aplicativos que casam com todos os termos, ou None se não houver termos."""
+        terms = tuple(SEARCH_TOKEN_RE.findall(normalize_text(query)))
+        if not terms:
+            return None
+        last = self.last_terms
+        if self.last_result is not None and len(terms) >= len(last) and all(
+                term.startswith(previous) for term, previous in zip(terms, last)):
+            # A busca estende a anterior: basta restringir o resultado anterior pelos termos novos
+            result = self.last_result
+            pending = [term for index, term in enumerate(terms) if index >= len(last) or term != last[index]]
+        else:
+            result, pending = None, terms
+        for term in pending:
+            positions = self.lookup(term)
+            result = positions if result is None else result & positions
+            if not result:
+                break
+        self.last_terms, self.last_result = terms, result
+        return result
+
+class CategoryIndex:
+    """Categoria -> nomes dos aplicativos, atualizado de forma incremental, com contagens."""
+    def __init__(self):
+        self.names = {}  # Categoria -> conjunto de nomes
+
+    def add(self, apps):
+        for app in apps:
+            self.names.setdefault(app.category, set()).add(app.name)
+
+    def remove(self, apps):
+        for app in apps:
+            names = self.names.get(app.category)
+            if names is not None:
+                names.discard(app.name)
+                if not names:
+                    del self.names[app.category]
+
+    def count(self, category):
+        return len(self.names.get(category, ()))
+
+    def categories(self):
+        """Categorias com aplicativos, em ordem alfabética."""
+        return sorted(self.names)
+
+    def get(self, category):
+        """Nomes dos aplicativos da categoria; não deve ser alterado."""
+        return self.names.get(category, frozenset())
+
+class CompletionIndex:
+    """Termos de autocompletar (nomes, categorias e tags), sem repetições e ponderados pela frequência.
+
+    A busca por prefixo usa bisect sobre as chaves normalizadas ordenadas e guarda as melhores
+    sugestões de cada prefixo consultado até a próxima alteração.
+    """
+    PREFIX_CACHE_SIZE = 256
+
+    def __init__(self, apps=()):
+        self.terms = {}  # Chave normalizada -> [texto exibido, frequência]
+        self.keys = []  # Chaves ordenadas
+        self.top = {}  # Prefixo -> melhores sugestões
+        self.add(apps)
+
+    @staticmethod
+    def _app_terms(app):
+        return (text for text in (app.name, app.category, *app.tags) if text)
+
+    def add(self, apps):
+        new_keys = []
+        for app in apps:
+            for text in self._app_terms(app):
+                key = normalize_text(text)
+                entry = self.terms.get(key)
+                if entry is None:
+                    self.terms[key] = [text, 1]
+                    new_keys.append(key)
+                else:
+                    entry[1] += 1
+        if len(new_keys) > len(self.keys) // 8:
+            self.keys = sorted(self.terms)
+        else:
+            for key in new_keys:
+                insort(self.keys, key)
+        self.top.clear()
+
+    def remove(self, apps):
+        for app in apps:
+            for text in self._app_terms(app):
+                key = normalize_text(text)
+                entry = self.terms.get(key)
+                if entry is None:
+                    continue
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self.terms[key]
+                    del self.keys[bisect_left(self.keys, key)]
+        self.top.clear()
+
+    def search(self, prefix, limit=COMPLETION_LIMIT):
+        """Retorna até limit termos que começam com prefix, dos mais frequentes aos menos."""
+        prefix = normalize_text(prefix.strip())
+        if not prefix:
+            return []
+        result = self.top.get(prefix)
+        if result is None:
+            start, end = bisect_left(self.keys, prefix), bisect_left(self.keys, prefix + "\uffff")
+            best = heapq.nlargest(limit, self.keys[start:end], key=lambda key: self.terms[key][1])
+            result = [self.terms[key][0] for key in best]
+            if len(self.top) >= self.PREFIX_CACHE_SIZE:
+                self.top.clear()
+            self.top[prefix] = result
+        return result
+
+def token_trigrams(token):
+    """Trigramas de um token, com espaços marcando início e fim."""
+    padded = f"  {token} "
+    return tuple(padded[start:start + 3] for start in range(len(padded) - 2))
+
+def text_trigrams(text):
+    """Trigramas de todos os tokens de um texto normalizado."""
+    return [gram for token in SEARCH_TOKEN_RE.findall(text) for gram in token_trigrams(token)]
+
+class TrigramIndex:
+    """Índice de trigramas para busca aproximada e ordenada por relevância.
+
+    Cada entrada guarda a posição do aplicativo e o peso do campo mais relevante em que o
+    trigrama aparece (nome, tags ou descrição), codificados como posição * 4 + peso.
+    """
+    def __init__(self, apps):
+        self.postings = {}  # Trigrama -> array de posição * 4 + peso
+        grams_by_token = {}  # Tokens se repetem muito entre aplicativos
+        for app in apps:
+            weights = {}
+            # Em ordem crescente de peso, para que o campo mais relevante prevaleça
+            for weight, texts in ((SEARCH_WEIGHT_DESCRIPTION, (app.description_key,)),
+                                  (SEARCH_WEIGHT_TAGS, app.tags_key), (SEARCH_WEIGHT_NAME, (app.name_key,))):
+                for text in texts:
+                    for token in SEARCH_TOKEN_RE.findall(text):
+                        grams = grams_by_token.get(token)
+                        if grams is None:
+                            grams = grams_by_token[token] = token_trigrams(token)
+                        weights.update(dict.fromkeys(grams, weight))
+            for gram, weight in weights.items():
+                postings = self.postings.get(gram)
+                if postings is None:
+                    self.postings[gram] = postings = array("I")
+                postings.append(app.position << 2 | weight)
+
+    def search(self, query, limit, allowed=None):
+        """Retorna as posições dos limit aplicativos mais relevantes, em ordem, restritas a allowed se informado."""
+        grams = set(text_trigrams(normalize_text(query)))
+        if not grams:
+            return []
+        scores, hits = {}, {}
+        for gram in grams:
+            for code in self.postings.get(gram, ()):
+                position = code >> 2
+                scores[position] = scores.get(position, 0) + (code & 3)
+                hits[position] = hits.get(position, 0) + 1
+        # Tolera erros de digitação exigindo só parte dos trigramas da busca
+        min_hits = max(1, math.ceil(len(grams) * SEARCH_FUZZY_MIN_SIMILARITY))
+        candidates = (position for position, count in hits.items()
+                      if count >= min_hits and (allowed is None or position in allowed))
+        return heapq.nlargest(limit, candidates, key=lambda position: (scores[position], -position))
+
+class SearchPipeline:
+    """Agrupa mudanças rápidas da busca em uma única passada após um intervalo de silêncio.
+
+    Cada mudança inicia uma nova geração e descarta a passada pendente da geração anterior.
+    A duração das passadas concluídas fica em timings.
+    """
+    def __init__(self, run, delay_ms=SEARCH_DEBOUNCE_MS):
+        self.run = run  # Chamado com a geração da passada
+        self.delay_ms = delay_ms
+        self.generation = 0
+        self.source_id = None
+        self.timings = collections.deque(maxlen=100)  # (geração, milissegundos) das últimas passadas
+
+    def schedule(self):
+        """Agenda uma passada, substituindo a pendente."""
+        self.cancel()
+        self.source_id = GLib.timeout_add(self.delay_ms, self._run_pass, self.generation)
+
+    def cancel(self):
+        """Descarta a passada pendente e invalida as que estiverem em andamento."""
+        self.generation += 1
+        if self.source_id is not None:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+
+    def is_current(self, generation):
+        """Indica se a passada da geração informada ainda não foi substituída."""
+        return generation == self.generation
+
+    def _run_pass(self, generation):
+        self.source_id = None
+        if not self.is_current(generation):
+            return False
+        start = time.perf_counter()
+        self.run(generation)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.timings.append((generation, elapsed))
+        if elapsed > SEARCH_SLOW_PASS_MS:
+            print(f"Busca lenta: {elapsed:.1f} ms")
+        return False
+
+    def average_ms(self):
+        """Duração média das últimas passadas, em milissegundos."""
+        return sum(elapsed for _, elapsed in self.timings) / len(self.timings) if self.timings else 0.0
+
+class PixbufCache:
+    """Cache LRU de imagens decodificadas, por (caminho, largura, altura), limitado em bytes.
+
+    Quem grava ou remove um arquivo de imagem deve chamar invalidate(caminho).
+    """
+    def __init__(self, budget=PIXBUF_CACHE_BYTES):
+        self.budget = budget
+        self.entries = collections.OrderedDict()  # (caminho, largura, altura) -> Pixbuf, do menos ao mais recente
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _pixbuf_bytes(pixbuf):
+        return pixbuf.get_rowstride() * pixbuf.get_height()
+
+    def load(self, path, width, height):
+        """Retorna a imagem do arquivo no tamanho pedido, decodificando-a só se não estiver em cache."""
+        key = (path, width, height)
+        pixbuf = self.entries.get(key)
+        if pixbuf is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return pixbuf
+        self.misses += 1
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(path, width, height)
+        self.entries[key] = pixbuf
+        self.size += self._pixbuf_bytes(pixbuf)
+        while self.size > self.budget and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= self._pixbuf_bytes(evicted)
+        return pixbuf
+
+    def invalidate(self, path):
+        """Descarta todos os tamanhos em cache de um arquivo alterado ou removido."""
+        for key in [key for key in self.entries if key[0] == path]:
+            self.size -= self._pixbuf_bytes(self.entries.pop(key))
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "bytes": self.size}
+
+def image_variant_path(path, width, height):
+    """Caminho da versão reduzida de uma imagem em cache."""
+    return f"{path}@{width}x{height}.png"
+
+def image_variant_sizes(size):
+    """Tamanhos em pixels das versões reduzidas de uma imagem exibida em size, uma por escala de tela."""
+    return [(size[0] * scale, size[1] * scale) for scale in IMAGE_SCALES]
+
+def write_image_variants(path, sizes):
+    """Grava versões reduzidas da imagem em path e retorna os tamanhos gravados. Roda fora da thread da UI."""
+    written = []
+    for width, height in sizes:
+        variant = image_variant_path(path, width, height)
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(path, width, height)
+            pixbuf.savev(f"{variant}.part", "png", [], [])
+            os.replace(f"{variant}.part", variant)
+            written.append((width, height))
+        except (GLib.Error, OSError) as e:
+            print(f"Erro ao reduzir imagem {path} para {width}x{height}: {e}")
+    return written
+
+class ImageCache:
+    """Cache em disco de imagens baixadas, endereçado pelo hash da URL e limitado em bytes.
+
+    O índice guarda tamanho, último acesso e versões reduzidas de cada imagem; ao passar do limite,
+    as menos usadas recentemente são removidas. Acessado apenas na thread da UI, exceto path().
+    """
+    def __init__(self, directory, budget, on_evict=None):
+        self.directory = directory
+        self.index_file = os.path.join(directory, "index.json")
+        self.budget = budget
+        self.on_evict = on_evict  # Chamado com o caminho de cada arquivo removido
+        self.entries = {}  # Hash da URL -> {"size": bytes, "atime": último acesso, "variants": [[largura, altura]]}
+        self.size = 0
+        self.dirty = False
+        self.started = time.time()
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def path(self, url):
+        """Caminho do arquivo da URL no cache, exista ele ou não."""
+        return os.path.join(self.directory, self.key(url))
+
+    def _load_index(self):
+        try:
+            with open(self.index_file) as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            if os.path.exists(self.index_file):
+                print(f"Erro ao carregar índice do cache de imagens: {e}")
+            entries = {}
+        # Uma leitura da pasta em vez de um stat por entrada; arquivos removidos depois são tratados em lookup()
+        try:
+            with os.scandir(self.directory) as files:
+                present = {file.name for file in files}
+        except OSError as e:
+            print(f"Erro ao ler cache de imagens: {e}")
+            present = set()
+        for key, entry in entries.items():
+            if isinstance(entry, dict) and key in present:
+                self.entries[key] = {"size": int(entry.get("size", 0)), "atime": float(entry.get("atime", 0)),
+                                     "variants": [list(size) for size in entry.get("variants", [])]}
+        self.size = sum(entry["size"] for entry in self.entries.values())
+        self._evict()
+
+    def save(self):
+        """Grava o índice se ele mudou desde a última gravação. Retorna True para uso em GLib.timeout_add."""
+        if self.dirty:
+            try:
+                with open(f"{self.index_file}.part", "w") as f:
+                    json.dump(self.entries, f)
+                os.replace(f"{self.index_file}.part", self.index_file)
+                self.dirty = False
+            except OSError as e:
+                print(f"Erro ao salvar índice do cache de imagens: {e}")
+        return True
+
+    def lookup(self, url):
+        """Retorna o caminho da imagem em cache da URL, marcando-a como usada, ou None.
+
+        Confia no índice, sem acessar o disco; um arquivo removido fora do aplicativo é descartado
+        com discard() quando sua leitura falhar.
+        """
+        key = self.key(url)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if now - entry["atime"] >= IMAGE_CACHE_ATIME_RESOLUTION_S:
+            entry["atime"] = now
+            self.dirty = True
+        return os.path.join(self.directory, key)
+
+    def variant(self, path, width, height):
+        """Caminho da versão reduzida de path em width x height, ou o próprio path se ela não existir."""
+        entry = self.entries.get(os.path.basename(path))
+        if entry and [width, height] in entry["variants"]:
+            return image_variant_path(path, width, height)
+        return path
+
+    def add(self, path, variants=()):
+        """Registra um arquivo recém-gravado em path(url), com suas versões reduzidas, e aplica o limite de tamanho."""
+        key = os.path.basename(path)
+        try:
+            size = os.path.getsize(path)
+            size += sum(os.path.getsize(image_variant_path(path, *variant)) for variant in variants)
+        except OSError:
+            return
+        old = self.entries.pop(key, None)
+        if old:
+            self.size -= old["size"]
+        self.entries[key] = {"size": size, "atime": time.time(), "variants": [list(variant) for variant in variants]}
+        self.size += size
+        self.dirty = True
+        self._evict(keep=key)
+
+    def discard(self, url):
+        """Remove a imagem da URL, se estiver em cache."""
+        if url and self.key(url) in self.entries:
+            self._drop(self.key(url))
+
+    def _drop(self, key):
+        entry = self.entries.pop(key)
+        self.size -= entry["size"]
+        self.dirty = True
+        original = os.path.join(self.directory, key)
+        for path in [original] + [image_variant_path(original, *variant) for variant in entry["variants"]]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Erro ao remover imagem do cache {path}: {e}")
+            if self.on_evict:
+                self.on_evict(path)
+
+    def _evict(self, keep=None):
+        if self.size <= self.budget:
+            return
+        target = self.budget * IMAGE_CACHE_LOW_WATERMARK
+        for key in sorted(self.entries, key=lambda key: self.entries[key]["atime"]):
+            if self.size <= target:
+                break
+            if key != keep:
+                self._drop(key)
+
+    def sweep(self, known, legacy_dir):
+        """Remove arquivos fora do índice e capturas de tela do formato antigo. Roda em segundo plano.
+
+        known são as chaves do índice quando a varredura começou; arquivos gravados depois do início
+        do aplicativo são mantidos, pois podem estar aguardando registro.
+        """
+        removed = 0
+        for directory, is_stale in ((self.directory, lambda entry: entry.name.split("@")[0] not in known and entry.name != "index.json"),
+                                    (legacy_dir, lambda entry: "_screenshot_" in entry.name or entry.name.endswith(".part"))):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file() and is_stale(entry) and entry.stat().st_mtime < self.started:
+                                os.remove(entry.path)
+                                removed += 1
+                        except OSError as e:
+                            print(f"Erro ao limpar cache de imagens {entry.path}: {e}")
+            except OSError as e:
+                print(f"Erro ao limpar cache de imagens em {directory}: {e}")
+        return removed
+
+class ImageFetchHandle:
+    """Tarefa enfileirada no ImageFetcher. cancel() a descarta se ainda não tiver começado."""
+    __slots__ = ("cancelled", "on_cancel")
+
+    def __init__(self, on_cancel=None):
+        self.cancelled = False
+        self.on_cancel = on_cancel
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            if self.on_cancel:
+                self.on_cancel(self)
+
+class ImageFlight:
+    """Download em andamento de uma URL e os interessados em seu resultado."""
+    __slots__ = ("path", "sizes", "priority", "waiters", "tasks", "lock", "started", "abandoned")
+
+    def __init__(self, path, sizes, priority):
+        self.path = path
+        self.sizes = sizes  # Versões reduzidas a gerar após o download
+        self.priority = priority
+        self.waiters = []  # (ImageFetchHandle, callback)
+        self.tasks = []  # Tarefas enfileiradas; só a primeira a rodar baixa
+        self.lock = threading.Lock()  # Protege started e abandoned, decididos entre a thread da UI e o pool
+        self.started = False  # Uma tarefa começou o download; o voo fica registrado até _finish
+        self.abandoned = False  # Todos os interessados saíram antes do início; as tarefas não baixam
+
+class ImageFetcher:
+    """Executa downloads de imagens em um número fixo de threads, por ordem de prioridade.
+
+    Tarefas de mesma prioridade saem na ordem de chegada; tarefas canceladas são descartadas.
+    """
+    def __init__(self, workers, on_written=None):
+        self.on_written = on_written  # Chamado com o caminho e as versões reduzidas de cada arquivo gravado, antes dos interessados
+        self.queue = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.flights = {}  # URL -> ImageFlight; acessado apenas na thread da UI
+        for _ in range(max(1, workers)):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def submit(self, priority, task):
+        """Enfileira task (executada em uma thread do pool) e retorna seu ImageFetchHandle."""
+        handle = ImageFetchHandle()
+        self.queue.put((priority, next(self.counter), handle, task))
+        return handle
+
+    def fetch(self, url, path, priority, callback, sizes=()):
+        """Baixa url para path, com no máximo um download em andamento por URL.
+
+        Chamado na thread da UI; callback(ok) também roda nela quando o download termina. O arquivo
+        é gravado em um temporário e renomeado, então path nunca fica parcialmente escrito, e as
+        versões reduzidas em sizes são geradas na mesma tarefa. O handle retornado retira apenas
+        este interessado; o download é descartado se nenhum outro restar.
+        """
+        flight = self.flights.get(url)
+        if flight is None:
+            flight = self.flights[url] = ImageFlight(path, sizes, priority)
+        waiter = ImageFetchHandle(lambda handle: self._leave(url, flight, handle))
+        flight.waiters.append((waiter, callback))
+        if not flight.tasks or priority < flight.priority:
+            # Um interessado mais urgente reenfileira o download; a tarefa antiga vira um no-op
+            flight.priority = priority
+            flight.tasks.append(self.submit(priority, lambda: self._download(url, flight)))
+        return waiter
+
+    def _leave(self, url, flight, waiter):
+        flight.waiters = [entry for entry in flight.waiters if entry[0] is not waiter]
+        if flight.waiters:
+            return
+        with flight.lock:
+            # Um download já iniciado continua registrado até _finish, para que novos pedidos se juntem a ele
+            if flight.started:
+                return
+            flight.abandoned = True
+        for task in flight.tasks:
+            task.cancel()
+        if self.flights.get(url) is flight:
+            del self.flights[url]
+
+    def _download(self, url, flight):
+        with flight.lock:
+            if flight.started or flight.abandoned:
+                return  # Outra tarefa do mesmo download já o executou, ou _leave o descartou
+            flight.started = True
+        partial = f"{flight.path}.{threading.get_ident()}.part"
+        try:
+            with urllib.request.urlopen(url, timeout=IMAGE_FETCH_TIMEOUT_S) as response, open(partial, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            os.replace(partial, flight.path)
+            ok = True
+        except Exception as e:
+            print(f"Erro ao baixar imagem {url}: {e}")
+            if os.path.exists(partial):
+                os.remove(partial)
+            ok = False
+        variants = write_image_variants(flight.path, flight.sizes) if ok else []
+        GLib.idle_add(self._finish, url, flight, ok, variants)
+
+    def _finish(self, url, flight, ok, variants):
+        if self.flights.get(url) is flight:
+            del self.flights[url]
+        if ok and self.on_written:
+            self.on_written(flight.path, variants)
+        for waiter, callback in flight.waiters:
+            if not waiter.cancelled:
+                callback(ok)
+        return False
+
+    def pending(self):
+        return self.queue.qsize()
+
+    def _work(self):
+        while True:
+            _, _, handle, task = self.queue.get()
+            if handle.cancelled:
+                continue
+            try:
+                task()
+            except Exception as e:
+                print(f"Erro ao baixar imagem: {e}")
+
+def parse_catalog_urls(value):
+    """Separa as URLs de catálogo configuradas (por vírgula ou espaço), na ordem e sem repetições."""
+    urls = []
+    for url in value.replace(",", " ").split():
+        if url not in urls:
+            urls.append(url)
+    return urls or [DEFAULT_APPS_DATA_URL]
+
+def merge_catalogs(catalogs):
+    """Une os registros de várias fontes. Em nomes repetidos, vale a primeira fonte."""
+    merged, seen = [], set()
+    for records in catalogs:
+        for app in records:
+            if app.name not in seen:
+                seen.add(app.name)
+                merged.append(app)
+    return merged
+
+class CatalogSource:
+    """Fonte de catálogo com cache, validadores HTTP e último catálogo aplicado próprios."""
+    def __init__(self, url, cache_prefix, timeout, validator, index_validator):
+        self.url = url
+        self.timeout = timeout
+        self.cache_file = f"{cache_prefix}.json"
+        self.cache_meta_file = f"{cache_prefix}_meta.json"
+        self.binary_cache_file = f"{cache_prefix}.bin"
+        self.validator = validator
+        self.index_validator = index_validator
+        self.digest = None  # Hash do JSON em cache do último catálogo aplicado
+        self.records = None  # Registros aceitos do último catálogo aplicado
+        self.streamed = []  # Registros já exibidos de um download em andamento, enquanto records é None
+        self.shards = None  # Modelos de URL dos fragmentos, se o catálogo for fragmentado
+        self.report = ValidationReport()
+
+    def _tag(self, records):
+        for app in records:
+            app.source = self.url
+        return records
+
+    def prepare(self, data):
+        """Valida o catálogo em lotes e cria os registros. Executado fora da thread da UI.
+
+        Retorna (registros aceitos, relatório, fragmentos).
+        """
+        records, shards = split_catalog(data)
+        # Entradas de um índice fragmentado só trazem os campos da lista
+        validator = self.validator if shards is None else self.index_validator
+        valid_apps, report = [], ValidationReport()
+        for start in range(0, len(records), CATALOG_BATCH_SIZE):
+            accepted, batch_report = validator.validate_batch(records[start:start + CATALOG_BATCH_SIZE])
+            valid_apps.extend(AppRecord.from_dict(app) for app in accepted)
+            report.merge(batch_report)
+        if report.rejected:
+            print(f"Aplicativos inválidos no catálogo {self.url}:\n{report.summary()}")
+        return self._tag(valid_apps), report, shards
+
+    def load_cache_meta(self):
+        """Carrega os validadores HTTP (ETag/Last-Modified) do catálogo em cache."""
+        try:
+            if os.path.exists(self.cache_meta_file) and os.path.exists(self.cache_file):
+                with open(self.cache_meta_file, 'r') as f:
+                    meta = json.load(f)
+                # Validadores só valem para a URL que os gerou
+                if meta.get("url") == self.url:
+                    return meta
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Erro ao carregar metadados do cache: {e}")
+        return {}
+
+    def save_cache_meta(self, headers, digest):
+        """Salva os validadores HTTP da última resposta e o hash do JSON junto ao cache."""
+        meta = {"url": self.url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"),
+                "digest": digest}
+        try:
+            with open(self.cache_meta_file, 'w') as f:
+                json.dump(meta, f)
+        except IOError as e:
+            print(f"Erro ao salvar metadados do cache: {e}")
+
+    def cache_digest(self, path=None):
+        """Identifica o conteúdo do JSON em cache (ou de path), para reconhecer um catálogo já aplicado."""
+        digest = hashlib.sha256()
+        with open(path or self.cache_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def cache_file_stat(self):
+        """Identifica a versão do JSON em cache pelo tamanho e data de modificação."""
+        stat = os.stat(self.cache_file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def save_binary_cache(self, apps, shards):
+        """Salva o catálogo validado no cache binário."""
+        try:
+            write_binary_cache(self.binary_cache_file, self.cache_file_stat(), apps, shards)
+        except (IOError, ValueError) as e:
+            print(f"Erro ao salvar cache binário: {e}")
+
+    def load_binary_cache(self):
+        """Carrega o cache binário, se válido para o JSON em cache. Retorna True se carregou."""
+        try:
+            cached = read_binary_cache(self.binary_cache_file, self.cache_file_stat())
+        except OSError:
+            return False
+        if not cached:
+            return False
+        self.records, self.shards = self._tag(cached[0]), cached[1]
+        self.digest = self.load_cache_meta().get("digest")
+        return True
+
+    def load_cache(self):
+        """Lê e valida o JSON em cache, regravando o cache binário.
+
+        Retorna (hash do JSON, registros aceitos, relatório, fragmentos), como fetch.
+        """
+        with open(self.cache_file, 'rb') as f:
+            body = f.read()
+        valid_apps, report, shards = self.prepare(json.loads(body))
+        self.save_binary_cache(valid_apps, shards)
+        return hashlib.sha256(body).hexdigest(), valid_apps, report, shards
+
+    def fetch(self, on_batch=None, allow_delta=True):
+        """Baixa o catálogo, comprimido ou como delta quando o servidor suportar, e atualiza o cache.
+
+        Retorna (hash do JSON gravado, registros aceitos, relatório, fragmentos). Cada lote de
+        registros validados é repassado a on_batch durante o download. Um 304 é propagado como
+        HTTPError. A árvore JSON recebida não é mantida após a criação dos registros.
+        """
+        meta = self.load_cache_meta()
+        request = urllib.request.Request(self.url, headers={"Accept-Encoding": CATALOG_ACCEPT_ENCODING})
+        if meta.get("etag"):
+            request.add_header("If-None-Match", meta["etag"])
+            if allow_delta:
+                request.add_header("A-IM", CATALOG_DELTA_IM)
+        if meta.get("last_modified"):
+            request.add_header("If-Modified-Since", meta["last_modified"])
+
+        partial_cache = f"{self.cache_file}.{threading.get_ident()}.part"  # Downloads sobrepostos não compartilham o arquivo
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as url:
+                stream = open_catalog_stream(url)
+                if allow_delta and meta.get("etag") and url.status == 226 and url.headers.get("IM", "").strip() == CATALOG_DELTA_IM:
+                    # Apenas as diferenças desde a versão em cache foram enviadas
+                    try:
+                        delta = json.load(stream)
+                        if delta.get("base", meta["etag"]) != meta["etag"]:
+                            raise ValueError("Delta gerado a partir de outra versão do catálogo")
+                        with open(self.cache_file, 'r') as f:
+                            base = json.load(f)
+                        records, shards = split_catalog(base)
+                        data = apply_catalog_delta(records, delta)
+                        if shards is not None:
+                            data = dict(base, apps=data)
+                    except (ValueError, AttributeError, IOError) as e:
+                        print(f"Delta do catálogo inválido, baixando catálogo completo: {e}")
+                        return self.fetch(on_batch, allow_delta=False)
+                    with open(partial_cache, 'w') as f:
+                        json.dump(data, f, separators=(",", ":"))
+                    valid_apps, report, shards = self.prepare(data)
+                elif stream.peek(64).lstrip()[:1] == b"{":
+                    # Índice de catálogo fragmentado: pequeno, analisado de uma vez
+                    body = stream.read()
+                    with open(partial_cache, 'wb') as f:
+                        f.write(body)
+                    valid_apps, report, shards = self.prepare(json.loads(body.decode()))
+                else:
+                    with open(partial_cache, 'wb') as sink:
+                        valid_apps, report, shards = [], ValidationReport(), None
+                        for batch in iter_json_array(stream, sink=sink):
+                            accepted, batch_report = self.validator.validate_batch(batch)
+                            records = self._tag([AppRecord.from_dict(app) for app in accepted])
+                            valid_apps.extend(records)
+                            report.merge(batch_report)
+                            if on_batch:
+                                on_batch(records)
+                        # Os demais formatos passam por prepare(), que já relata os rejeitados
+                        if report.rejected:
+                            print(f"Aplicativos inválidos no catálogo {self.url}:\n{report.summary()}")
+                digest = self.cache_digest(partial_cache)
+                if digest != meta.get("digest"):
+                    # Conteúdo igual mantém o arquivo, e com ele o cache binário ainda válido
+                    os.replace(partial_cache, self.cache_file)
+                self.save_cache_meta(url.headers, digest)
+        finally:
+            if os.path.exists(partial_cache):
+                os.remove(partial_cache)
+        return digest, valid_apps, report, shards
 
 class AppImageShop(Gtk.Window):
     """Janela principal do AppImage Shop."""
@@ -28,7 +1182,6 @@ class AppImageShop(Gtk.Window):
         self.config_dir = os.path.expanduser("~/.local/share/AppImageShop")
         self.config_file = os.path.join(self.config_dir, "config.ini")
         self.downloads_file = os.path.join(self.config_dir, "downloads.json")
-        self.cache_file = os.path.join(self.config_dir, "apps_cache.json")
         os.makedirs(self.config_dir, exist_ok=True)
 
         # Inicializa configuração e diretórios
@@ -36,9 +1189,15 @@ class AppImageShop(Gtk.Window):
         self.load_config()
         self.appimage_dir = self.config.get('Downloads', 'appimage_dir')
         self.apps_data_url = self.config.get('Downloads', 'apps_data_url')
-        self.icon_dir = os.path.expanduser("~/.local/share/AppImageShop/icons")
+        self.icon_dir = os.path.expanduser("~/.local/share/AppImageShop/icons")  # Ícones das entradas de desktop
+        self.image_cache_dir = os.path.join(self.config_dir, "images")
+        self.shard_dir = os.path.join(self.config_dir, "shards")
+        self.catalog_dir = os.path.join(self.config_dir, "catalogs")
+        self.applications_dir = os.path.expanduser("~/.local/share/applications")
         os.makedirs(self.appimage_dir, exist_ok=True)
         os.makedirs(self.icon_dir, exist_ok=True)
+        os.makedirs(self.shard_dir, exist_ok=True)
+        os.makedirs(self.catalog_dir, exist_ok=True)
 
         # Define o ícone da janela
         self.set_app_icon()
@@ -47,16 +1206,57 @@ class AppImageShop(Gtk.Window):
         self.downloads = {}  # Downloads ativos
         self.download_threads = {}  # Threads para downloads ativos
         self.download_history = self.load_download_history()
-        self.apps = []  # Lista de aplicativos disponíveis
+        self.pixbuf_cache = PixbufCache()  # Ícones e capturas de tela já decodificados
+        self.image_cache = ImageCache(self.image_cache_dir, self.config.getint('Downloads', 'image_cache_mb') * 1024 * 1024,
+                                      on_evict=self.pixbuf_cache.invalidate)  # Ícones e capturas de tela baixados
+        self.image_fetcher = ImageFetcher(self.config.getint('Downloads', 'image_workers'),
+                                          on_written=self._on_image_written)  # Downloads de ícones e capturas
+        threading.Thread(target=self.image_cache.sweep, args=(set(self.image_cache.entries), self.icon_dir), daemon=True).start()
+        GLib.timeout_add_seconds(IMAGE_CACHE_SAVE_INTERVAL_S, self.image_cache.save)
+        self.connect("destroy", lambda window: self.image_cache.save())
+        self.details_fetches = {}  # Pilha de visões -> downloads de imagens da página de detalhes aberta nela
+        self.installed_versions = {}  # Nome -> versão da entrada de desktop (None se ausente) dos AppImages instalados
+        self.installed_monitors = []  # Gio.FileMonitor da pasta de AppImages e da de entradas de desktop
+        self.installed_changes = set()  # Nomes alterados no disco ainda não refletidos nas listas
+        self.installed_refresh_id = None
+        self.fs_stats = {"scandir": 0, "stat": 0}  # Acessos ao disco para o estado de instalação
+        self._watch_installed()
+        self.apps = []  # Registros (AppRecord) dos aplicativos disponíveis, na ordem do catálogo
+        self.apps_by_name = {}  # Nome -> registro
+        self.category_index = CategoryIndex()  # Categoria -> nomes, com contagens para a barra lateral
+        self.selected_category = "Todos"  # Categoria ativa na barra lateral
+        self.app_rows = {}  # Nome -> linha da loja, mantida para todo o catálogo e filtrada pela ListBox
+        self.installed_rows = {}  # Nome -> linha da lista de aplicativos instalados
+        self.row_pool = []  # Linhas de aplicativo removidas, prontas para receber outro registro
+        self.row_pool_stats = {"hits": 0, "misses": 0}  # Linhas reaproveitadas e criadas
+        self.background_icons = set()  # Nomes das linhas da loja ocultas cujo ícone espera na fila em segundo plano
+        self.populate_generation = 0  # Incrementado a cada preenchimento da loja, cancelando o anterior
+        self.populate_pending = collections.deque()  # Registros cujas linhas o preenchimento ocioso ainda vai criar
+        self.store_filter = (None, "Todos")  # Posições que casam com a busca e categoria aplicadas à loja
+        self.search_index = SearchIndex()  # Busca por tokens do catálogo exibido
+        self.trigram_index = None  # Busca aproximada, construída em segundo plano quando habilitada
+        self.search_rank = {}  # Posição -> ordem de relevância na busca aproximada atual
+        self.completion_index = CompletionIndex()  # Sugestões do autocompletar da busca
+        self.search_pipeline = SearchPipeline(self.filter_app_list)
+        self.validator = CatalogValidator(APP_SCHEMA)
+        self.index_validator = CatalogValidator(APP_INDEX_SCHEMA)
+        self.app_details = {}  # Nome -> registro completo (AppRecord) carregado de um fragmento
+        self.loaded_categories = set()  # (URL da fonte, categoria) cujo fragmento de detalhes já foi carregado
+        self.validation_report = ValidationReport()  # Resultado da última validação do catálogo
+        self.catalog_sources = []  # Fontes de catálogo (CatalogSource), na ordem de precedência
+        self._setup_catalog_sources()
 
         # Aplica CSS e configura UI
         self._apply_css()
         self._setup_ui()
 
-        # Carrega aplicativos e inicia verificação de atualizações se auto_refresh estiver habilitado
+        # Exibe o catálogo em cache imediatamente e revalida em segundo plano
+        has_cache = self.load_apps_from_cache()
         if self.config.getboolean('Settings', 'auto_refresh'):
             self.load_apps_from_url()
             GLib.timeout_add_seconds(int(self.config['Settings']['update_interval']), self.check_for_updates)
+        elif not has_cache:
+            self.load_apps_from_url()
 
     def set_app_icon(self):
         """Define o ícone da janela, baixando de APP_ICON_URL se necessário."""
@@ -83,11 +1283,13 @@ class AppImageShop(Gtk.Window):
     def load_config(self):
         """Carrega configuração do config.ini com valores padrão."""
         defaults = {
-            'Settings': {'auto_refresh': 'True', 'last_tab': '0', 'last_category': 'Todos', 'update_interval': '3600'},
+            'Settings': {'auto_refresh': 'True', 'last_tab': '0', 'last_category': 'Todos', 'update_interval': '3600',
+                         'fuzzy_search': 'False'},
             'Accessibility': {'high_contrast': 'False', 'font_scale': '1.0'},
             'Appearance': {'theme': 'Sistema'},
             'Downloads': {'appimage_dir': os.path.expanduser("~/.local/bin/AppImages"),
-                         'apps_data_url': DEFAULT_APPS_DATA_URL}
+                         'apps_data_url': DEFAULT_APPS_DATA_URL, 'source_timeout': '15', 'image_workers': '4',
+                         'image_cache_mb': '200'}
         }
         if os.path.exists(self.config_file):
             self.config.read(self.config_file)
@@ -112,10 +1314,107 @@ class AppImageShop(Gtk.Window):
         self.appimage_dir = self.config['Downloads']['appimage_dir']
         self.apps_data_url = self.config['Downloads']['apps_data_url']
         os.makedirs(self.appimage_dir, exist_ok=True)
+        self._watch_installed()
         self._apply_css()
+        self._build_trigram_index()
+        if self._setup_catalog_sources():
+            # Exibe só as fontes mantidas; as novas aparecem ao terminar o download
+            self._apply_sources()
+            self.load_apps_from_url()
         self.refresh_app_list()
         self.refresh_downloads_list()
 
+    # Estado de Instalação
+    def _watch_installed(self):
+        """Lê o estado de instalação do disco e passa a observar suas mudanças com Gio.FileMonitor."""
+        for monitor in self.installed_monitors:
+            monitor.cancel()
+        self.installed_monitors = []
+        self.installed_versions = {}
+        self._scan_installed()
+
+        for path in (self.appimage_dir, self.applications_dir):
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+            except GLib.Error as e:
+                print(f"Erro ao observar {path}: {e}")
+                continue
+            monitor.connect("changed", self._on_installed_dir_changed)
+            self.installed_monitors.append(monitor)
+
+    def _scan_installed(self):
+        """Sincroniza o estado de instalação com uma única leitura da pasta de AppImages.
+
+        Linhas e detalhes consultam esse retrato com is_installed, sem acessar o disco por aplicativo.
+        Retorna os nomes cujo estado mudou.
+        """
+        self.fs_stats["scandir"] += 1
+        try:
+            with os.scandir(self.appimage_dir) as entries:
+                names = {entry.name[:-len(".AppImage")] for entry in entries if entry.name.endswith(".AppImage")}
+        except OSError as e:
+            print(f"Erro ao ler diretório de AppImages: {e}")
+            return set()
+        changed = set(self.installed_versions) ^ names
+        for name in set(self.installed_versions) - names:
+            del self.installed_versions[name]
+        for name in names - set(self.installed_versions):
+            self.installed_versions[name] = self._read_desktop_version(name)
+        return changed
+
+    def is_installed(self, name):
+        """Indica se o AppImage do aplicativo está instalado, segundo o último retrato da pasta."""
+        return name in self.installed_versions
+
+    def _read_desktop_version(self, name):
+        """Retorna a versão registrada na entrada de desktop do aplicativo, ou None."""
+        desktop_path = os.path.join(self.applications_dir, f"{name}.desktop")
+        try:
+            with open(desktop_path, 'r') as f:
+                return next((line.split("Versão:")[1].strip() for line in f if line.startswith("Comment=Versão:")), None)
+        except (IOError, UnicodeDecodeError):
+            return None
+
+    def _on_installed_dir_changed(self, monitor, file, other_file, event_type):
+        """Atualiza o estado de instalação dos arquivos alterados e agenda a atualização das listas."""
+        for changed_file in (file, other_file):
+            filename = changed_file.get_basename() if changed_file else None
+            if filename and filename.endswith(".AppImage"):
+                name = filename[:-len(".AppImage")]
+            elif filename and filename.endswith(".desktop"):
+                name = filename[:-len(".desktop")]
+            else:
+                continue
+            if self._update_installed_state(name):
+                self.installed_changes.add(name)
+        # Gravações geram vários eventos seguidos: atualiza uma vez quando cessarem
+        if self.installed_changes:
+            if self.installed_refresh_id is not None:
+                GLib.source_remove(self.installed_refresh_id)
+            self.installed_refresh_id = GLib.timeout_add(INSTALLED_REFRESH_DELAY_MS, self._apply_installed_changes)
+
+    def _update_installed_state(self, name):
+        """Relê do disco o estado de instalação de um aplicativo. Retorna True se mudou."""
+        self.fs_stats["stat"] += 1
+        if os.path.exists(os.path.join(self.appimage_dir, f"{name}.AppImage")):
+            version = self._read_desktop_version(name)
+            if self.installed_versions.get(name, ()) == version:
+                return False
+            self.installed_versions[name] = version
+            return True
+        return self.installed_versions.pop(name, ()) != ()
+
+    def _apply_installed_changes(self):
+        """Reflete nas listas as mudanças de instalação detectadas no disco."""
+        self.installed_refresh_id = None
+        changes, self.installed_changes = self.installed_changes, set()
+        for name in changes:
+            row = self.app_rows.get(name)
+            if row:
+                self._bind_app_row(row, row.app_record, self.app_list)
+        self.refresh_my_apps_list()
+        return False
+
     def load_download_history(self):
         """Carrega histórico de downloads do downloads.json."""
         try:
@@ -274,9 +1573,12 @@ class AppImageShop(Gtk.Window):
 
         self.search_entry = Gtk.Entry(placeholder_text="Pesquisar aplicativos ou tags...")
         self.search_entry.connect("changed", self.on_search_changed)
+        # O modelo só contém as sugestões do texto atual, já filtradas pelo índice de autocompletar
+        self.completion_model = Gtk.ListStore(str)
         completion = Gtk.EntryCompletion()
-        completion.set_model(self._create_completion_model())
+        completion.set_model(self.completion_model)
         completion.set_text_column(0)
+        completion.set_match_func(lambda completion, key, tree_iter: True)
         self.search_entry.set_completion(completion)
         search_box.pack_start(self.search_entry, True, True, 0)
 
@@ -286,6 +1588,8 @@ class AppImageShop(Gtk.Window):
         search_box.pack_start(clear_button, False, False, 0)
 
         self.app_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        self.app_list.set_sort_func(self._sort_app_rows)
+        self.app_list.set_filter_func(self._filter_app_row)
         self.app_list.connect("row-activated", self.on_app_selected)
         scrolled_window = Gtk.ScrolledWindow(margin_start=20, margin_end=20, margin_bottom=20)
         scrolled_window.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
@@ -306,7 +1610,22 @@ class AppImageShop(Gtk.Window):
         list_box.pack_start(header, False, False, 0)
 
         self.installed_app_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        self.installed_app_list.set_sort_func(
+            lambda row1, row2: self._app_position(row1.app_name) - self._app_position(row2.app_name))
         self.installed_app_list.connect("row-activated", self.on_app_selected)
+
+        empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        empty_box.get_style_context().add_class("app-row")
+        empty_icon = Gtk.Image.new_from_icon_name("dialog-information", Gtk.IconSize.DIALOG)
+        empty_label = Gtk.Label(label="Nenhum aplicativo instalado.")
+        explore_button = Gtk.Button(label="Explorar Loja")
+        explore_button.set_tooltip_text("Voltar para a aba Loja")
+        explore_button.connect("clicked", lambda btn: self.notebook.set_current_page(0))
+        empty_box.pack_start(empty_icon, False, False, 0)
+        empty_box.pack_start(empty_label, False, False, 0)
+        empty_box.pack_start(explore_button, False, False, 0)
+        empty_box.show_all()
+        self.installed_app_list.set_placeholder(empty_box)
         scrolled = Gtk.ScrolledWindow(margin=10)
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scrolled.add(self.installed_app_list)
@@ -336,73 +1655,402 @@ class AppImageShop(Gtk.Window):
 
         return downloads_box
 
-    def validate_app_data(self, app):
-        """Valida os campos obrigatórios e tipos do JSON de um aplicativo."""
-        required_fields = ["name", "description", "appimage_url", "icon_url", "category", "app", "version", "details", "license", "size", "last_updated"]
-        optional_fields = ["screenshots", "tags", "alternative_versions"]
-        for field in required_fields:
-            if field not in app:
-                return False, f"Campo '{field}' ausente"
-            if not isinstance(app[field], str):
-                return False, f"Campo '{field}' deve ser uma string"
-        for field in optional_fields:
-            if field in app:
-                if field == "screenshots" and not isinstance(app[field], list):
-                    return False, "Campo 'screenshots' deve ser uma lista"
-                if field == "tags" and not isinstance(app[field], list):
-                    return False, "Campo 'tags' deve ser uma lista de strings"
-                if field == "alternative_versions" and not isinstance(app[field], list):
-                    return False, "Campo 'alternative_versions' deve ser uma lista"
-        if "screenshots" in app:
-            for screenshot in app["screenshots"]:
-                if not isinstance(screenshot, dict) or "url" not in screenshot or "caption" not in screenshot:
-                    return False, "Cada captura de tela deve ter 'url' e 'caption'"
-        return True, ""
+    def _setup_catalog_sources(self):
+        """Cria as fontes de catálogo a partir das URLs configuradas, na ordem de precedência.
+
+        Fontes já existentes são reaproveitadas. Retorna True se a lista de fontes mudou.
+        """
+        timeout = self.config.getfloat('Downloads', 'source_timeout')
+        existing = {source.url: source for source in self.catalog_sources}
+        old_urls = list(existing)
+        self.catalog_sources = []
+        for index, url in enumerate(parse_catalog_urls(self.apps_data_url)):
+            source = existing.get(url)
+            if source is None:
+                prefix = os.path.join(self.catalog_dir, hashlib.sha1(url.encode()).hexdigest())
+                source = CatalogSource(url, prefix, timeout, self.validator, self.index_validator)
+                if index == 0:
+                    self._migrate_legacy_cache(source, prefix)
+            source.timeout = timeout
+            self.catalog_sources.append(source)
+        return [source.url for source in self.catalog_sources] != old_urls
+
+    def _migrate_legacy_cache(self, source, prefix):
+        """Move o cache de fonte única das versões anteriores para a fonte principal."""
+        legacy = os.path.join(self.config_dir, "apps_cache")
+        if os.path.exists(source.cache_file) or not os.path.exists(f"{legacy}.json"):
+            return
+        for suffix in (".json", "_meta.json", ".bin"):
+            if os.path.exists(f"{legacy}{suffix}"):
+                os.replace(f"{legacy}{suffix}", f"{prefix}{suffix}")
+
+    def _source_of(self, app):
+        """Retorna a fonte de catálogo de onde veio o aplicativo."""
+        return next((source for source in self.catalog_sources if source.url == app.source), None)
+
+    def load_apps_from_cache(self):
+        """Exibe os catálogos salvos localmente, se existirem. Retorna True se algum foi carregado."""
+        cached = [source for source in self.catalog_sources if os.path.exists(source.cache_file)]
+        pending = [source for source in cached if not source.load_binary_cache()]
+        if len(pending) < len(cached):
+            self._apply_sources()
+
+        # Cabeçalho ausente ou incompatível: recorre ao JSON, validado fora da thread da UI
+        def load_json_async(source):
+            try:
+                digest, valid_apps, report, shards = source.load_cache()
+            except (ValueError, IOError) as e:
+                print(f"Erro ao carregar catálogo em cache de {source.url}: {e}")
+                return
+            GLib.idle_add(self._update_source, source, digest, valid_apps, report, shards, True)
+
+        for source in pending:
+            threading.Thread(target=load_json_async, args=(source,), daemon=True).start()
+        return bool(cached)
 
     def load_apps_from_url(self):
-        """Carrega aplicativos da URL JSON configurada de forma assíncrona com cache."""
-        self.header_bar.set_subtitle("Carregando aplicativos...")
+        """Carrega os catálogos de todas as fontes em paralelo, de forma assíncrona com cache."""
+        has_apps = bool(self.apps)
+        # Com o catálogo em cache já visível, a busca apenas revalida os dados
+        self.header_bar.set_subtitle("Verificando atualizações..." if has_apps else "Carregando aplicativos...")
         spinner = Gtk.Spinner()
         spinner.start()
         self.header_bar.pack_start(spinner)
-
-        def load_async():
+        sources = list(self.catalog_sources)
+        for source in sources:
+            source.streamed = []
+        pending = [len(sources)]
+        errors, from_cache = [], []
+        streamed, interrupted = set(), []  # Fontes com lotes já exibidos e as que falharam depois disso
+
+        def finish():
+            # Cada fonte é exibida ao chegar; o indicador só some quando todas terminarem
+            pending[0] -= 1
+            if pending[0]:
+                return
+            spinner.stop()
+            self.header_bar.remove(spinner)
+            self.header_bar.set_subtitle("Sua Loja de AppImage - Desde 2025")
+            if interrupted:
+                # Descarta os lotes exibidos de downloads interrompidos, mantendo apenas catálogos completos
+                for source in interrupted:
+                    source.streamed = []
+                self._apply_sources()
+            if from_cache:
+                self.show_notification("Carregado do cache devido a falha na rede.")
+            if errors and self.apps and not interrupted:
+                print("\n".join(errors))
+            elif errors:
+                self.show_error_dialog("\n".join(errors), True)
+
+        def load_from_cache(source):
+            digest, valid_apps, report, shards = source.load_cache()
+            GLib.idle_add(self._update_source, source, digest, valid_apps, report, shards, True)
+
+        def show_batch(source, records):
+            # Sem catálogo na tela, exibe cada lote assim que chega
+            streamed.add(source)
+            GLib.idle_add(self._append_apps_batch, source, records)
+
+        def load_async(source):
+            completed = False
             try:
-                with urllib.request.urlopen(self.apps_data_url) as url:
-                    data = json.loads(url.read().decode())
-                    with open(self.cache_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-                    GLib.idle_add(self._update_apps, data)
-            except urllib.error.URLError as e:
-                if os.path.exists(self.cache_file):
-                    with open(self.cache_file, 'r') as f:
-                        data = json.load(f)
-                    GLib.idle_add(self._update_apps, data)
-                    GLib.idle_add(self.show_notification, "Carregado do cache devido a falha na rede.")
+                digest, valid_apps, report, shards = source.fetch(None if has_apps else lambda records: show_batch(source, records))
+                if digest != source.digest:
+                    source.save_binary_cache(valid_apps, shards)  # Só após uma mudança no catálogo
+                GLib.idle_add(self._update_source, source, digest, valid_apps, report, shards)
+                completed = True
+            except (ValueError, EOFError, zlib.error, gzip.BadGzipFile) as e:
+                errors.append(f"Dados de aplicativo inválidos em {source.url}: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                # URLError, tempo esgotado, conexão encerrada ou resposta truncada no meio do download
+                reason = getattr(e, "reason", e)
+                if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                    # Catálogo inalterado: nada a baixar, analisar ou redesenhar
+                    if source.records is None:
+                        load_from_cache(source)
+                elif source.records is not None:
+                    print(f"Falha ao revalidar catálogo {source.url}, mantendo versão em cache: {reason}")
+                elif os.path.exists(source.cache_file):
+                    load_from_cache(source)
+                    from_cache.append(source.url)
                 else:
-                    GLib.idle_add(self.show_error_dialog, f"Falha ao carregar aplicativos: {e.reason}", True)
-            except json.JSONDecodeError as e:
-                GLib.idle_add(self.show_error_dialog, f"Dados de aplicativo inválidos: {e}", False)
+                    errors.append(f"Falha ao carregar aplicativos de {source.url}: {reason}")
             finally:
-                GLib.idle_add(spinner.stop)
-                GLib.idle_add(self.header_bar.remove, spinner)
+                if not completed and source in streamed:
+                    interrupted.append(source)
+                GLib.idle_add(finish)
+
+        # Uma thread por fonte: um espelho lento ou fora do ar não atrasa os demais
+        for source in sources:
+            threading.Thread(target=load_async, args=(source,), daemon=True).start()
+
+    def _update_source(self, source, digest, valid_apps, report, shards, from_cache=False):
+        """Registra o catálogo validado de uma fonte e exibe a união de todas as fontes.
+
+        digest é o hash do JSON em cache de onde vieram os registros.
+        """
+        if source not in self.catalog_sources or digest == source.digest:
+            return  # Fonte removida ou revalidação trouxe o mesmo catálogo já exibido
+        if from_cache and source.digest is not None:
+            return  # O download terminou antes da leitura do cache
+        if shards != source.shards:
+            for app in source.records or ():
+                self.app_details.pop(app.name, None)
+            self.loaded_categories = {key for key in self.loaded_categories if key[0] != source.url}
+        source.digest, source.records, source.report, source.shards = digest, valid_apps, report, shards
+        source.streamed = []
+        self._apply_sources()
+
+    def _apply_sources(self):
+        """Exibe a união dos catálogos carregados, na ordem de precedência das fontes.
+
+        Fontes ainda baixando entram com os lotes já exibidos, para que suas linhas não sumam até o fim do download.
+        """
+        sources = [source for source in self.catalog_sources if source.records is not None or source.streamed]
+        self.validation_report = ValidationReport()
+        for source in sources:
+            if source.records is not None:
+                self.validation_report.merge(source.report)
+        self._apply_apps(merge_catalogs(source.records if source.records is not None else source.streamed
+                                        for source in sources))
+
+    def _index_apps(self, apps):
+        """Registra aplicativos no índice por nome e no de busca, na ordem do catálogo."""
+        for app in apps:
+            app.position = len(self.apps)
+            self.apps.append(app)
+            self.apps_by_name[app.name] = app
+        self.search_index.add(apps)
+
+    def _apply_apps(self, valid_apps):
+        """Exibe aplicativos já validados, atualizando apenas o que mudou."""
+        old_apps, old_by_name = self.apps, self.apps_by_name
+        self.apps, self.apps_by_name = [], {}
+        self.search_index = SearchIndex()
+        self._index_apps(valid_apps)
+        self._build_trigram_index()
+        if old_apps:
+            added, removed, changed = diff_catalogs(old_apps, valid_apps)
+            # Só entradas adicionadas, removidas ou alteradas podem mudar de categoria
+            replaced = removed + [old_by_name[app.name] for app in changed]
+            self.category_index.remove(replaced)
+            self.category_index.add(added + changed)
+            self.completion_index.remove(replaced)
+            self.completion_index.add(added + changed)
+            self._setup_category_buttons()
+            self._apply_catalog_diff(old_apps, added, removed, changed)
+        else:
+            self.category_index = CategoryIndex()
+            self.category_index.add(valid_apps)
+            self._build_completion_index()
+            self._setup_category_buttons()
+            self.refresh_app_list()
+        self.notebook.set_current_page(self.config.getint('Settings', 'last_tab'))
+
+    def _build_trigram_index(self):
+        """Reconstrói em segundo plano o índice da busca aproximada, se habilitada."""
+        self.trigram_index = None
+        if not self.config.getboolean('Settings', 'fuzzy_search'):
+            return
+        apps = self.apps
+
+        def apply(index):
+            if apps is self.apps:  # Descarta índices de um catálogo já substituído
+                self.trigram_index = index
+                if self.search_entry.get_text():
+                    self.filter_app_list()
+
+        threading.Thread(target=lambda: GLib.idle_add(apply, TrigramIndex(apps)), daemon=True).start()
+
+    def _append_apps_batch(self, source, valid_apps):
+        """Exibe um lote de aplicativos validados recebido durante o download do catálogo de source."""
+        if source not in self.catalog_sources or source.records is not None:
+            return  # Fonte removida ou já aplicada por completo
+        source.streamed.extend(valid_apps)
+        # Com várias fontes baixando, o primeiro a chegar é exibido até a união final
+        valid_apps = [app for app in valid_apps if app.name not in self.apps_by_name]
+        self._index_apps(valid_apps)
+        self.category_index.add(valid_apps)
+        self.completion_index.add(valid_apps)
+        self._setup_category_buttons()
+        self.store_filter = self._current_filter()
+        for app in valid_apps:
+            if app.name not in self.app_rows:
+                row = self._create_app_row(app, self.app_list)
+                row.show_all()
+                self.app_rows[app.name] = row
+        # A união final compara os mesmos registros e não tocará a lista de instalados
+        if any(app.name in self.installed_versions for app in valid_apps):
+            self.refresh_my_apps_list()
+
+    def _apply_catalog_diff(self, old_apps, added, removed, changed):
+        """Atualiza apenas as linhas afetadas pelas diferenças entre catálogos."""
+        # As posições mudaram: o resultado da busca é recalculado e reaplicado a todas as linhas
+        was_ranked = bool(self.search_rank)
+        self.store_filter = self._current_filter()
+        # Ícones de aplicativos removidos ou trocados no catálogo não serão mais usados. Só uma união
+        # de todas as fontes completas decide isso; uma parcial pode omitir aplicativos ainda a caminho
+        if all(source.records is not None for source in self.catalog_sources):
+            old_by_name = {app.name: app for app in old_apps}
+            for app in removed:
+                self.image_cache.discard(app.icon_url)
+            for app in changed:
+                if old_by_name[app.name].icon_url != app.icon_url:
+                    self.image_cache.discard(old_by_name[app.name].icon_url)
+        for app in removed + changed + added:
+            # Detalhes carregados de fragmentos deixam de valer quando a entrada muda
+            if self.app_details.pop(app.name, None):
+                self.loaded_categories.discard((app.source, app.category))
+        for app in removed:
+            row = self.app_rows.pop(app.name, None)
+            if row:
+                self._release_app_row(row, self.app_list)
+        new_apps = []
+        for app in changed + added:
+            row = self.app_rows.get(app.name)
+            if row:
+                self._bind_app_row(row, app, self.app_list)
+            else:
+                new_apps.append(app)
+        # Linhas novas são criadas aos poucos pelo preenchimento ocioso, as visíveis primeiro
+        visible = [app for app in new_apps if self._app_matches_filter(app, *self.store_filter)]
+        hidden = [app for app in new_apps if not self._app_matches_filter(app, *self.store_filter)]
+        if self.populate_pending:
+            self.populate_pending.extendleft(reversed(visible))
+            self.populate_pending.extend(hidden)
+        elif new_apps:
+            self.populate_pending = collections.deque(visible + hidden)
+            GLib.idle_add(self._populate_app_rows, self.populate_generation, self.populate_pending)
+        self.app_list.invalidate_filter()
+
+        # Reordena somente se a ordem relativa dos aplicativos mantidos ou a relevância na busca mudou
+        old_names = {app.name for app in old_apps}
+        kept_old = [app.name for app in old_apps if app.name in self.apps_by_name]
+        kept_new = [app.name for app in self.apps if app.name in old_names]
+        if kept_old != kept_new or was_ranked or self.search_rank:
+            self.app_list.invalidate_sort()
+            self.installed_app_list.invalidate_sort()
+
+        touched = [app.name for app in added + removed + changed]
+        if any(name in self.installed_versions for name in touched):
+            self.refresh_my_apps_list()
+
+    def get_app_record(self, app):
+        """Retorna o registro completo do aplicativo, incluindo detalhes carregados de fragmentos."""
+        return self.app_details.get(app.name, app)
+
+    def _shard_url(self, source, template, **fields):
+        """Monta a URL de um fragmento a partir do modelo do índice, relativa à URL do catálogo."""
+        try:
+            path = template.format(**{key: quote(value, safe="") for key, value in fields.items()})
+        except (KeyError, IndexError, ValueError, AttributeError) as e:
+            raise ValueError(f"Modelo de fragmento inválido {template!r}: {e!r}") from e
+        return urljoin(source.url, path)
+
+    def fetch_shard(self, url, timeout):
+        """Baixa um fragmento de detalhes com requisição condicional, usando a cópia local se possível."""
+        shard_path = os.path.join(self.shard_dir, f"{hashlib.sha1(url.encode()).hexdigest()}.json")
+        cached = None
+        if os.path.exists(shard_path):
+            try:
+                with open(shard_path, 'r') as f:
+                    cached = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                cached = None
+        request = urllib.request.Request(url, headers={"Accept-Encoding": CATALOG_ACCEPT_ENCODING})
+        if cached and cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                data = json.load(open_catalog_stream(response))
+                etag = response.headers.get("ETag")
+        except (OSError, http.client.HTTPException):
+            if cached:  # 304, falha de rede ou tempo esgotado: usa a cópia local
+                return cached["data"]
+            raise
+        with open(shard_path, 'w') as f:
+            json.dump({"etag": etag, "data": data}, f)
+        return data
+
+    def fetch_app_details(self, app):
+        """Baixa o fragmento com os detalhes do aplicativo. Retorna nome -> registro completo validado."""
+        source = self._source_of(app)
+        shards = source.shards
+        if "app" in shards:
+            records = [self.fetch_shard(self._shard_url(source, shards["app"], name=app.name), source.timeout)]
+        elif "category" in shards:
+            records = self.fetch_shard(self._shard_url(source, shards["category"], category=app.category), source.timeout)
+        else:
+            raise ValueError("O índice do catálogo não define fragmentos de detalhes")
+        if not isinstance(records, list):
+            raise ValueError("Fragmento de categoria deve ser uma lista")
+        accepted, report = self.validator.validate_batch(records)
+        if report.rejected:
+            print(f"Aplicativos inválidos no fragmento:\n{report.summary()}")
+        return {record["name"]: source._tag([AppRecord.from_dict(record)])[0] for record in accepted}
+
+    def _store_app_details(self, details, source, category=None):
+        """Guarda detalhes carregados, se ainda correspondem à versão e à fonte do catálogo."""
+        for name, record in details.items():
+            app = self.apps_by_name.get(name)
+            if app and app.source == source.url and record.version == app.version:
+                self.app_details[name] = record
+        if category:
+            self.loaded_categories.add((source.url, category))
+
+    def load_app_details(self, app, callback):
+        """Chama callback com o registro completo do aplicativo, baixando seu fragmento se necessário."""
+        source = self._source_of(app)
+        if source is None or source.shards is None or app.name in self.app_details:
+            callback(self.get_app_record(app))
+            return
+        self.header_bar.set_subtitle(f"Carregando detalhes de {app.name}...")
+
+        def load_async():
+            try:
+                details = self.fetch_app_details(app)
+            except (OSError, http.client.HTTPException, ValueError, EOFError, zlib.error) as e:
+                # OSError inclui URLError, tempo esgotado e gzip.BadGzipFile
                 GLib.idle_add(self.header_bar.set_subtitle, "Sua Loja de AppImage - Desde 2025")
+                GLib.idle_add(self.show_notification, f"Erro ao carregar detalhes de {app.name}: {e}")
+                return
+
+            def apply():
+                self.header_bar.set_subtitle("Sua Loja de AppImage - Desde 2025")
+                self._store_app_details(details, source)
+                if app.name in self.app_details:
+                    callback(self.get_app_record(app))
+                else:
+                    self.show_notification(f"Detalhes de {app.name} não encontrados no catálogo.")
+            GLib.idle_add(apply)
 
         threading.Thread(target=load_async, daemon=True).start()
 
-    def _update_apps(self, data):
-        """Atualiza a lista de aplicativos com validação e atualiza a UI."""
-        valid_apps = []
-        for app in data:
-            is_valid, error = self.validate_app_data(app)
-            if is_valid:
-                valid_apps.append(app)
-            else:
-                print(f"Aplicativo inválido: {error}")
-        self.apps = valid_apps
-        self._setup_category_buttons()
-        self.refresh_app_list()
-        self.notebook.set_current_page(self.config.getint('Settings', 'last_tab'))
+    def prefetch_category_details(self, category):
+        """Carrega em segundo plano o fragmento de detalhes de uma categoria selecionada."""
+        def load_async(source, url):
+            try:
+                records = self.fetch_shard(url, source.timeout)
+                accepted, report = self.validator.validate_batch(records if isinstance(records, list) else [])
+            except (OSError, http.client.HTTPException, ValueError, EOFError, zlib.error) as e:
+                print(f"Erro ao carregar detalhes da categoria {category}: {e}")
+                return
+            details = {record["name"]: source._tag([AppRecord.from_dict(record)])[0] for record in accepted}
+            GLib.idle_add(self._store_app_details, details, source, category)
+
+        # Cada fonte fragmentada com aplicativos na categoria tem seu próprio fragmento
+        sources = {self.apps_by_name[name].source for name in self.category_index.get(category)}
+        for source in self.catalog_sources:
+            shards = source.shards
+            if source.url not in sources or not shards or "category" not in shards or (source.url, category) in self.loaded_categories:
+                continue
+            try:
+                url = self._shard_url(source, shards["category"], category=category)
+            except ValueError as e:
+                print(f"Erro ao carregar detalhes da categoria {category}: {e}")
+                continue
+            threading.Thread(target=load_async, args=(source, url), daemon=True).start()
 
     def check_for_updates(self):
         """Verifica periodicamente por atualizações do JSON."""
@@ -412,68 +2060,182 @@ class AppImageShop(Gtk.Window):
         return False
 
     def _setup_category_buttons(self):
-        """Configura botões de categoria na barra lateral."""
+        """Sincroniza os botões de categoria da barra lateral e suas contagens com o catálogo."""
+        categories = self.category_index.categories()
+        self.category_buttons["Todos"].set_label(f"Todos ({len(self.apps)})")
         for category, button in list(self.category_buttons.items()):
-            if category != "Todos":
+            if category != "Todos" and category not in categories:
+                if button.get_active():
+                    self.category_buttons["Todos"].set_active(True)
                 self.sidebar.remove(button)
                 del self.category_buttons[category]
 
-        categories = sorted(set(app["category"] for app in self.apps))
-        for category in categories:
-            button = Gtk.RadioButton.new_with_label_from_widget(self.category_group, category)
-            button.connect("toggled", self.on_category_toggled, category)
-            button.get_style_context().add_class("category-button")
-            self.category_buttons[category] = button
-            self.sidebar.pack_start(button, False, False, 0)
-        self.sidebar.show_all()
+        # Título e "Todos" ocupam as duas primeiras posições da barra lateral
+        for position, category in enumerate(categories, start=2):
+            button = self.category_buttons.get(category)
+            if button is None:
+                button = Gtk.RadioButton.new_with_label_from_widget(self.category_group, category)
+                button.connect("toggled", self.on_category_toggled, category)
+                button.get_style_context().add_class("category-button")
+                self.category_buttons[category] = button
+                self.sidebar.pack_start(button, False, False, 0)
+                button.show_all()
+            button.set_label(f"{category} ({self.category_index.count(category)})")
+            self.sidebar.reorder_child(button, position)
+
+    def _current_filter(self):
+        """Retorna as posições que casam com a busca (None se vazia) e a categoria selecionada."""
+        search_text = self.search_entry.get_text()
+        selected_category = self.selected_category
+        self.search_rank = {}
+        if self.trigram_index is None or not search_text.strip():
+            # Busca exata; também usada enquanto o índice aproximado é construído
+            return self.search_index.search(search_text), selected_category
+        allowed = None
+        if selected_category != "Todos":
+            allowed = {self.apps_by_name[name].position for name in self.category_index.get(selected_category)}
+        ranked = self.trigram_index.search(search_text, SEARCH_TOP_K, allowed)
+        self.search_rank = {position: rank for rank, position in enumerate(ranked)}
+        return set(ranked), selected_category
+
+    def _app_matches_filter(self, app, matches, selected_category):
+        """Verifica se um aplicativo atende aos filtros de busca e categoria."""
+        if selected_category != "Todos" and app.category != selected_category:
+            return False
+        return matches is None or app.position in matches
+
+    def _app_position(self, name):
+        """Posição do aplicativo no catálogo; aplicativos fora do catálogo vão para o fim."""
+        app = self.apps_by_name.get(name)
+        return app.position if app else len(self.apps)
+
+    def _app_order(self, name):
+        """Ordem de exibição: resultados da busca aproximada por relevância, antes dos demais, na ordem do catálogo.
+
+        As ordens dos resultados ficam abaixo de zero, então as demais linhas não mudam de ordem entre buscas.
+        """
+        position = self._app_position(name)
+        rank = self.search_rank.get(position)
+        return position if rank is None else rank - SEARCH_TOP_K
 
-    def refresh_app_list(self):
-        """Atualiza a lista de aplicativos com base em filtros de busca e categoria."""
-        for child in self.app_list.get_children():
-            self.app_list.remove(child)
+    def _sort_app_rows(self, row1, row2):
+        """Ordena as linhas da loja por relevância ou pela posição dos aplicativos no catálogo."""
+        return self._app_order(row1.app_name) - self._app_order(row2.app_name)
 
-        search_text = self.search_entry.get_text().lower()
-        selected_category = next((cat for cat, btn in self.category_buttons.items() if btn.get_active()), "Todos")
+    def _filter_app_row(self, row):
+        """Função de filtro da ListBox da loja: mostra as linhas que atendem à busca e à categoria."""
+        app = self.apps_by_name.get(row.app_name)
+        return app is not None and self._app_matches_filter(app, *self.store_filter)
 
-        for app in self.apps:
-            if (selected_category == "Todos" or app["category"] == selected_category) and \
-               (not search_text or search_text in app["name"].lower() or search_text in app["description"].lower() or
-                any(search_text in tag.lower() for tag in app.get("tags", []))):
-                self._create_app_row(app, self.app_list)
+    def refresh_app_list(self):
+        """Recria as linhas da loja para todo o catálogo e sincroniza a lista de instalados."""
+        for row in self.app_rows.values():
+            self._release_app_row(row, self.app_list)
+        self.app_rows = {}
+        self.search_pipeline.cancel()
+        self.store_filter = self._current_filter()
+        # Um retrato da pasta por ciclo, caso o monitor tenha perdido eventos (por exemplo, em NFS)
+        self._scan_installed()
+
+        # Linhas visíveis primeiro, na ordem de exibição; as ocultas pelos filtros vêm depois
+        matches, selected_category = self.store_filter
+        if matches is None and selected_category != "Todos":
+            # Sem busca, a categoria é uma consulta direta ao índice
+            names = self.category_index.get(selected_category)
+            visible = sorted((self.apps_by_name[name] for name in names), key=lambda app: app.position)
+        else:
+            visible = [app for app in self.apps if self._app_matches_filter(app, matches, selected_category)]
+        if self.search_rank:
+            visible.sort(key=lambda app: self._app_order(app.name))
+        visible_names = {app.name for app in visible}
+        pending = self.populate_pending = collections.deque(visible)
+        pending.extend(app for app in self.apps if app.name not in visible_names)
+
+        self.populate_generation += 1
+        self._populate_app_rows(self.populate_generation, pending, ROW_FIRST_PAGE)
+        if pending:
+            GLib.idle_add(self._populate_app_rows, self.populate_generation, pending)
+        self.refresh_my_apps_list()
 
-        self.app_list.show_all()
+    def _populate_app_rows(self, generation, pending, limit=None):
+        """Cria linhas da loja da fila pending até limit linhas ou até esgotar o tempo da iteração.
+
+        Usado como callback ocioso enquanto houver linhas pendentes; um preenchimento mais novo o cancela.
+        """
+        if generation != self.populate_generation:
+            return False
+        deadline = time.perf_counter() + ROW_FRAME_BUDGET_MS / 1000
+        created = 0
+        while pending:
+            # A fila pode ter registros substituídos por uma atualização do catálogo nesse meio tempo
+            app = self.apps_by_name.get(pending.popleft().name)
+            if app and app.name not in self.app_rows:
+                row = self._create_app_row(app, self.app_list)
+                row.show_all()
+                self.app_rows[app.name] = row
+                created += 1
+            if created == limit or (limit is None and time.perf_counter() >= deadline):
+                break
+        return bool(pending)
+
+    def filter_app_list(self, generation=None):
+        """Aplica os filtros de busca e categoria às linhas existentes da loja, sem recriá-las.
+
+        generation identifica a passada do pipeline de busca; fora dele, a busca pendente é descartada,
+        pois o resultado atual já a inclui.
+        """
+        if generation is None:
+            self.search_pipeline.cancel()
+        old_rank = self.search_rank
+        self.store_filter = self._current_filter()
+        # Reposiciona apenas as linhas cuja relevância mudou (no máximo 2 * SEARCH_TOP_K), em vez de
+        # reordenar a loja inteira: retiradas todas antes, cada uma é reinserida na posição ordenada
+        moved = [self.app_rows.get(self.apps[position].name) for position in old_rank.keys() | self.search_rank.keys()
+                 if old_rank.get(position) != self.search_rank.get(position) and position < len(self.apps)]
+        moved = [row for row in moved if row]
+        for row in moved:
+            self.app_list.remove(row)
+        for row in moved:
+            self.app_list.insert(row, -1)
+        self.app_list.invalidate_filter()
+        # Linhas reveladas pelo filtro passam à frente dos ícones enfileirados em segundo plano
+        revealed = [row for row in map(self.app_rows.get, self.background_icons)
+                    if row and self._app_matches_filter(row.app_record, *self.store_filter)]
+        for row in revealed:
+            self.background_icons.discard(row.app_name)
+            if row.icon.fetch_handle:
+                self.get_custom_icon(row.app_record, row.icon, IMAGE_PRIORITY_VISIBLE)
+
+    def refresh_app_row(self, name):
+        """Atualiza a linha da loja de um aplicativo cujo estado de instalação mudou."""
+        # Não espera pelo monitor, que pode estar indisponível (por exemplo, em NFS)
+        self._update_installed_state(name)
+        self.installed_changes.discard(name)
+        row = self.app_rows.get(name)
+        if row:
+            self._bind_app_row(row, row.app_record, self.app_list)
         self.refresh_my_apps_list()
 
     def refresh_my_apps_list(self):
-        """Atualiza a lista de aplicativos instalados."""
+        """Sincroniza a lista de aplicativos instalados com o estado observado, recriando só as linhas que mudaram."""
         self.my_apps_stack.set_visible_child_name("list")
-        for child in self.installed_app_list.get_children():
-            self.installed_app_list.remove(child)
-
-        installed_apps = [app for app in self.apps if os.path.exists(os.path.join(self.appimage_dir, f"{app['name']}.AppImage"))]
-        if not installed_apps:
-            empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-            empty_box.get_style_context().add_class("app-row")
-            empty_icon = Gtk.Image.new_from_icon_name("dialog-information", Gtk.IconSize.DIALOG)
-            empty_label = Gtk.Label(label="Nenhum aplicativo instalado.")
-            explore_button = Gtk.Button(label="Explorar Loja")
-            explore_button.set_tooltip_text("Voltar para a aba Loja")
-            explore_button.connect("clicked", lambda btn: self.notebook.set_current_page(0))
-            empty_box.pack_start(empty_icon, False, False, 0)
-            empty_box.pack_start(empty_label, False, False, 0)
-            empty_box.pack_start(explore_button, False, False, 0)
-            self.installed_app_list.add(empty_box)
-        else:
-            for app in installed_apps:
-                appimage_path = os.path.join(self.appimage_dir, f"{app['name']}.AppImage")
-                desktop_path = os.path.expanduser(f"~/.local/share/applications/{app['name']}.desktop")
-                is_update = False
-                if os.path.exists(desktop_path):
-                    with open(desktop_path, 'r') as f:
-                        installed_version = next((line.split("Versão:")[1].strip() for line in f if line.startswith("Comment=Versão:")), app['version'])
-                        is_update = installed_version != app['version']
-                self._create_app_row(app, self.installed_app_list, is_update)
-        self.installed_app_list.show_all()
+        installed = {}
+        for name, installed_version in self.installed_versions.items():
+            app = self.apps_by_name.get(name)
+            if app:
+                installed[name] = (app, installed_version is not None and installed_version != app.version)
+
+        for name, row in list(self.installed_rows.items()):
+            if name not in installed:
+                self._release_app_row(row, self.installed_app_list)
+                del self.installed_rows[name]
+            elif installed[name] != (row.app_record, row.is_update):
+                self._bind_app_row(row, installed[name][0], self.installed_app_list, installed[name][1])
+        for name, (app, is_update) in installed.items():
+            if name not in self.installed_rows:
+                row = self._create_app_row(app, self.installed_app_list, is_update)
+                row.show_all()
+                self.installed_rows[name] = row
 
     def refresh_downloads_list(self):
         """Atualiza a lista de downloads com downloads ativos e histórico."""
@@ -489,53 +2251,108 @@ class AppImageShop(Gtk.Window):
         self.downloads_list.show_all()
 
     def _create_app_row(self, app, list_box, is_update=False):
-        """Cria uma linha de aplicativo para a lista."""
+        """Adiciona uma linha de aplicativo à lista, reaproveitando uma linha do pool se houver."""
+        if self.row_pool:
+            row = self.row_pool.pop()
+            self.row_pool_stats["hits"] += 1
+        else:
+            row = self._build_app_row()
+            self.row_pool_stats["misses"] += 1
+        self._bind_app_row(row, app, list_box, is_update)
+        list_box.add(row)
+        return row
+
+    def _release_app_row(self, row, list_box):
+        """Remove uma linha de aplicativo da lista e a devolve ao pool, se houver espaço."""
+        list_box.remove(row)
+        if row.icon.fetch_handle:
+            row.icon.fetch_handle.cancel()  # O ícone de uma linha descartada não precisa mais ser baixado
+        if list_box is self.app_list:
+            self.background_icons.discard(row.app_name)
+        if len(self.row_pool) < ROW_POOL_SIZE:
+            self.row_pool.append(row)
+
+    def _build_app_row(self):
+        """Cria os widgets de uma linha de aplicativo, sem dados; preenchida por _bind_app_row."""
         row = Gtk.ListBoxRow()
         row.get_style_context().add_class("app-row")
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, margin=8)
         row.add(box)
 
-        icon = self.get_custom_icon(app)
-        box.pack_start(icon, False, False, 0)
+        row.icon = Gtk.Image()
+        row.icon.fetch_handle = None
+        box.pack_start(row.icon, False, False, 0)
 
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         content_box.set_hexpand(True)
         box.pack_start(content_box, True, True, 0)
 
         name_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        name_label = Gtk.Label(label=app['name'], halign=Gtk.Align.START, ellipsize=Pango.EllipsizeMode.END)
-        name_label.get_style_context().add_class("title")
-        name_box.pack_start(name_label, False, False, 0)
-        
-        if is_update:
-            update_badge = Gtk.Label(label="Atualização")
-            update_badge.get_style_context().add_class("update-badge")
-            name_box.pack_start(update_badge, False, False, 0)
+        row.name_label = Gtk.Label(halign=Gtk.Align.START, ellipsize=Pango.EllipsizeMode.END)
+        row.name_label.get_style_context().add_class("title")
+        name_box.pack_start(row.name_label, False, False, 0)
+
+        # Widgets opcionais ficam fora do show_all; a visibilidade é definida a cada vínculo
+        row.update_badge = Gtk.Label(label="Atualização", no_show_all=True)
+        row.update_badge.get_style_context().add_class("update-badge")
+        name_box.pack_start(row.update_badge, False, False, 0)
         content_box.pack_start(name_box, False, False, 0)
 
-        version_label = Gtk.Label(label=f"v{app.get('version', 'N/A')} ({app.get('size', 'N/A')})", halign=Gtk.Align.START)
-        version_label.get_style_context().add_class("version")
-        content_box.pack_start(version_label, False, False, 0)
+        row.version_label = Gtk.Label(halign=Gtk.Align.START)
+        row.version_label.get_style_context().add_class("version")
+        content_box.pack_start(row.version_label, False, False, 0)
 
-        desc_label = Gtk.Label(label=app.get("description", "Sem descrição"), wrap=True, halign=Gtk.Align.START, max_width_chars=60)
-        desc_label.get_style_context().add_class("description")
-        content_box.pack_start(desc_label, False, False, 0)
+        row.desc_label = Gtk.Label(wrap=True, halign=Gtk.Align.START, max_width_chars=60)
+        row.desc_label.get_style_context().add_class("description")
+        content_box.pack_start(row.desc_label, False, False, 0)
 
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        appimage_path = os.path.join(self.appimage_dir, f"{app['name']}.AppImage")
-        action_button = Gtk.Button(label="Remover" if os.path.exists(appimage_path) else "Instalar")
-        action_button.get_style_context().add_class("destructive-action" if os.path.exists(appimage_path) else "suggested-action")
-        action_button.connect("clicked", self.on_action_clicked, app["name"], app.get("appimage_url", ""), os.path.exists(appimage_path), app.get("version"))
-        button_box.pack_start(action_button, False, False, 0)
+        row.action_button = Gtk.Button()
+        row.action_button.connect("clicked", self._on_row_action_clicked, row)
+        button_box.pack_start(row.action_button, False, False, 0)
 
-        if os.path.exists(appimage_path):
-            launch_button = Gtk.Button(label="Iniciar")
-            launch_button.get_style_context().add_class("suggested-action")
-            launch_button.connect("clicked", self.on_launch_clicked, app["name"])
-            button_box.pack_start(launch_button, False, False, 0)
+        row.launch_button = Gtk.Button(label="Iniciar", no_show_all=True)
+        row.launch_button.get_style_context().add_class("suggested-action")
+        row.launch_button.connect("clicked", lambda button: self.on_launch_clicked(button, row.app_name))
+        button_box.pack_start(row.launch_button, False, False, 0)
 
         box.pack_end(button_box, False, False, 0)
-        list_box.add(row)
+        return row
+
+    def _bind_app_row(self, row, app, list_box, is_update=False):
+        """Preenche uma linha de list_box com os dados e o estado de instalação de um aplicativo."""
+        installed = self.is_installed(app.name)
+        row.app_name = app.name
+        row.app_record = app
+        row.is_update = is_update
+        row.installed = installed
+        hidden = list_box is self.app_list and not self._app_matches_filter(app, *self.store_filter)
+        self.get_custom_icon(app, row.icon, IMAGE_PRIORITY_BACKGROUND if hidden else IMAGE_PRIORITY_VISIBLE)
+        if list_box is self.app_list:
+            if hidden and row.icon.fetch_handle:
+                self.background_icons.add(app.name)
+            else:
+                self.background_icons.discard(app.name)
+        row.name_label.set_text(app.name)
+        row.update_badge.set_visible(is_update)
+        row.version_label.set_text(f"v{app.version or 'N/A'} ({app.size or 'N/A'})")
+        row.desc_label.set_text(app.description or "Sem descrição")
+
+        self._set_action_button_state(row.action_button, installed)
+        row.launch_button.set_visible(installed)
+
+    def _set_action_button_state(self, button, installed):
+        """Habilita o botão de instalar/remover com o rótulo e o estilo do estado de instalação."""
+        button.set_sensitive(True)
+        button.set_label("Remover" if installed else "Instalar")
+        style = button.get_style_context()
+        style.remove_class("suggested-action" if installed else "destructive-action")
+        style.add_class("destructive-action" if installed else "suggested-action")
+
+    def _on_row_action_clicked(self, button, row):
+        """Repassa o clique de instalar/remover com o aplicativo atualmente vinculado à linha."""
+        app = row.app_record
+        self.on_action_clicked(button, app.name, app.appimage_url, row.installed, app.version)
 
     def _create_download_row(self, app_name, info):
         """Cria uma linha de progresso de download."""
@@ -563,51 +2380,102 @@ class AppImageShop(Gtk.Window):
 
         self.downloads_list.add(row)
 
-    def get_custom_icon(self, app):
-        """Carrega ou busca um ícone de aplicativo de forma assíncrona."""
-        icon = Gtk.Image.new_from_icon_name("application-x-executable", Gtk.IconSize.DIALOG)
-        icon_url = app.get("icon_url")
+    def get_custom_icon(self, app, icon=None, priority=IMAGE_PRIORITY_VISIBLE):
+        """Carrega ou busca um ícone de aplicativo de forma assíncrona.
+
+        Se icon for informado, a imagem existente (de uma linha reaproveitada) recebe o ícone
+        e o download pendente do ícone anterior é cancelado.
+        """
+        if icon is None:
+            icon = Gtk.Image()
+            icon.fetch_handle = None
+        elif icon.fetch_handle:
+            icon.fetch_handle.cancel()
+            icon.fetch_handle = None
+        icon.set_from_icon_name("application-x-executable", Gtk.IconSize.DIALOG)
+        icon.app_name = app.name  # Um download atrasado não sobrescreve a imagem já vinculada a outro app
+        icon_url = app.icon_url
         if not icon_url:
             return icon
 
-        icon_path = os.path.join(self.icon_dir, f"{quote(app['name'])}.png")
-        if os.path.exists(icon_path):
+        icon_path = self.image_cache.lookup(icon_url)
+        if icon_path:
             try:
-                icon.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file_at_size(icon_path, 64, 64))
+                self._set_cached_image(icon, icon_path, ICON_SIZE)
+                return icon
+            except FileNotFoundError:
+                self.image_cache.discard(icon_url)  # Removido fora do aplicativo: baixa de novo
             except Exception as e:
-                print(f"Erro ao carregar ícone para {app['name']}: {e}")
-            return icon
+                print(f"Erro ao carregar ícone para {app.name}: {e}")
+                return icon
+
+        icon_path = self.image_cache.path(icon_url)
+        icon.fetch_handle = self.image_fetcher.fetch(
+            icon_url, icon_path, priority,
+            lambda ok: ok and self._show_fetched_image(icon, icon_path, ICON_SIZE, app.name),
+            sizes=image_variant_sizes(ICON_SIZE))
+        return icon
 
-        def load_icon_async():
-            try:
-                urllib.request.urlretrieve(icon_url, icon_path)
-                GLib.idle_add(lambda: icon.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file_at_size(icon_path, 64, 64)))
-            except Exception as e:
-                print(f"Erro ao baixar ícone para {app['name']}: {e}")
+    def _on_image_written(self, path, variants):
+        """Registra no cache em disco uma imagem recém-baixada e descarta versões decodificadas antigas."""
+        for invalidated in [path] + [image_variant_path(path, *variant) for variant in variants]:
+            self.pixbuf_cache.invalidate(invalidated)
+        self.image_cache.add(path, variants)
 
-        threading.Thread(target=load_icon_async, daemon=True).start()
-        return icon
+    def _set_cached_image(self, image, path, size):
+        """Exibe em image a imagem em cache no tamanho size (em pontos), na escala da tela.
+
+        Usa a versão reduzida correspondente quando existir, evitando decodificar o original.
+        Levanta FileNotFoundError se o arquivo não existir mais.
+        """
+        scale = self.get_scale_factor()
+        width, height = size[0] * scale, size[1] * scale
+        source = self.image_cache.variant(path, width, height)
+        try:
+            pixbuf = self.pixbuf_cache.load(source, width, height)
+        except GLib.Error:
+            if not os.path.exists(source):
+                raise FileNotFoundError(source)
+            raise
+        if scale == 1:
+            image.set_from_pixbuf(pixbuf)
+        else:
+            image.set_from_surface(Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, self.get_window()))
+
+    def _show_fetched_image(self, image, path, size, app_name=None):
+        """Exibe uma imagem recém-baixada.
+
+        Com app_name, só a exibe se a imagem ainda pertencer ao aplicativo (linhas são reaproveitadas).
+        """
+        if app_name is None or image.app_name == app_name:
+            image.fetch_handle = None
+            try:
+                self._set_cached_image(image, path, size)
+            except (GLib.Error, FileNotFoundError) as e:
+                print(f"Erro ao carregar imagem {path}: {e}")
+        return False
 
     def get_screenshot_image(self, screenshot, app_name):
         """Carrega ou busca uma captura de tela de forma assíncrona."""
         image = Gtk.Image.new_from_icon_name("image-x-generic", Gtk.IconSize.DIALOG)
+        image.fetch_handle = None
         screenshot_url = screenshot.get("url")
-        screenshot_path = os.path.join(self.icon_dir, f"{quote(app_name)}_screenshot_{quote(screenshot_url.split('/')[-1])}")
-        if os.path.exists(screenshot_path):
+        screenshot_path = self.image_cache.lookup(screenshot_url)
+        if screenshot_path:
             try:
-                image.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file_at_size(screenshot_path, 400, 300))
+                self._set_cached_image(image, screenshot_path, SCREENSHOT_SIZE)
+                return image
+            except FileNotFoundError:
+                self.image_cache.discard(screenshot_url)  # Removida fora do aplicativo: baixa de novo
             except Exception as e:
                 print(f"Erro ao carregar captura de tela para {app_name}: {e}")
-            return image
+                return image
 
-        def load_screenshot_async():
-            try:
-                urllib.request.urlretrieve(screenshot_url, screenshot_path)
-                GLib.idle_add(lambda: image.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file_at_size(screenshot_path, 400, 300)))
-            except Exception as e:
-                print(f"Erro ao baixar captura de tela para {app_name}: {e}")
-
-        threading.Thread(target=load_screenshot_async, daemon=True).start()
+        screenshot_path = self.image_cache.path(screenshot_url)
+        image.fetch_handle = self.image_fetcher.fetch(
+            screenshot_url, screenshot_path, IMAGE_PRIORITY_DETAILS,
+            lambda ok: ok and self._show_fetched_image(image, screenshot_path, SCREENSHOT_SIZE),
+            sizes=image_variant_sizes(SCREENSHOT_SIZE))
         return image
 
     def on_search_changed(self, entry):
@@ -615,7 +2483,9 @@ class AppImageShop(Gtk.Window):
         self.notebook.set_current_page(0)
         self.store_stack.set_visible_child_name("apps")
         self.header_bar.set_subtitle("Sua Loja de AppImage - Desde 2025")
-        self.refresh_app_list()
+        self._update_completion(entry.get_text())
+        # Filtra uma vez quando a digitação pausa; a lista de instalados não depende da busca
+        self.search_pipeline.schedule()
 
     def on_category_toggled(self, button, category):
         """Manipula seleção de categoria."""
@@ -623,9 +2493,12 @@ class AppImageShop(Gtk.Window):
             self.notebook.set_current_page(0)
             self.store_stack.set_visible_child_name("apps")
             self.header_bar.set_subtitle("Sua Loja de AppImage - Desde 2025")
+            self.selected_category = category
             self.config['Settings']['last_category'] = category
             self.save_config()
-            self.refresh_app_list()
+            if category != "Todos":
+                self.prefetch_category_details(category)
+            self.filter_app_list()
 
     def on_refresh_clicked(self, button):
         """Manipula clique no botão de atualizar."""
@@ -724,10 +2597,10 @@ class AppImageShop(Gtk.Window):
         downloads_grid.attach(appimage_dir_label, 0, 0, 1, 1)
         downloads_grid.attach(appimage_dir_chooser, 1, 0, 1, 1)
 
-        apps_data_url_label = Gtk.Label(label="URL do JSON de Aplicativos", halign=Gtk.Align.START)
+        apps_data_url_label = Gtk.Label(label="URLs do JSON de Aplicativos", halign=Gtk.Align.START)
         apps_data_url_label.get_style_context().add_class("settings-label")
         apps_data_url_entry = Gtk.Entry(text=self.config.get('Downloads', 'apps_data_url'))
-        apps_data_url_entry.set_placeholder_text("Insira a URL do arquivo app.json")
+        apps_data_url_entry.set_placeholder_text("Insira uma ou mais URLs de app.json, separadas por vírgula")
         downloads_grid.attach(apps_data_url_label, 0, 1, 1, 1)
         downloads_grid.attach(apps_data_url_entry, 1, 1, 1, 1)
 
@@ -751,11 +2624,18 @@ class AppImageShop(Gtk.Window):
         general_grid.attach(update_interval_label, 0, 1, 1, 1)
         general_grid.attach(update_interval_spin, 1, 1, 1, 1)
 
+        fuzzy_search_label = Gtk.Label(label="Busca Aproximada", halign=Gtk.Align.START)
+        fuzzy_search_label.get_style_context().add_class("settings-label")
+        fuzzy_search_switch = Gtk.Switch(halign=Gtk.Align.END, active=self.config.getboolean('Settings', 'fuzzy_search'))
+        fuzzy_search_switch.set_tooltip_text("Tolerar erros de digitação e ordenar resultados por relevância")
+        general_grid.attach(fuzzy_search_label, 0, 2, 1, 1)
+        general_grid.attach(fuzzy_search_switch, 1, 2, 1, 1)
+
         reset_button = Gtk.Button(label="Redefinir Configurações")
         reset_button.get_style_context().add_class("destructive-action")
         reset_button.set_tooltip_text("Redefinir todas as configurações para o padrão")
         reset_button.connect("clicked", self.on_reset_settings_clicked)
-        general_grid.attach(reset_button, 1, 2, 1, 1)
+        general_grid.attach(reset_button, 1, 3, 1, 1)
 
         notebook.append_page(general_box, Gtk.Label(label="Geral"))
 
@@ -781,11 +2661,16 @@ class AppImageShop(Gtk.Window):
                 self.config['Downloads']['apps_data_url'] = apps_data_url_entry.get_text() or DEFAULT_APPS_DATA_URL
                 self.config['Settings']['auto_refresh'] = str(auto_refresh_switch.get_active())
                 self.config['Settings']['update_interval'] = str(int(update_interval_spin.get_value()))
+                self.config['Settings']['fuzzy_search'] = str(fuzzy_search_switch.get_active())
                 self.save_config()
                 self.appimage_dir = self.config.get('Downloads', 'appimage_dir')
                 self.apps_data_url = self.config.get('Downloads', 'apps_data_url')
                 os.makedirs(self.appimage_dir, exist_ok=True)
+                self._watch_installed()
                 self._apply_css()
+                self._build_trigram_index()
+                if self._setup_catalog_sources():
+                    self._apply_sources()
                 self.refresh_app_list()
                 self.refresh_downloads_list()
                 self.load_apps_from_url()
@@ -804,34 +2689,30 @@ class AppImageShop(Gtk.Window):
 
     def on_app_selected(self, listbox, row):
         """Manipula seleção de aplicativo no ListBox."""
-        if row and row.get_child():
-            box = row.get_child()
-            children = box.get_children()
-            if len(children) >= 2 and isinstance(children[1], Gtk.Box):  # Check if content_box exists
-                content_box = children[1]
-                name_box = content_box.get_children()[0]  # First child is name_box
-                name_label = name_box.get_children()[0]  # First child is name_label
-                if isinstance(name_label, Gtk.Label):
-                    app_name = name_label.get_label()
-                    app = next((a for a in self.apps if a["name"] == app_name), None)
-                    if app:
-                        print(f"App selecionado: {app_name}, Detalhes: {app}")
-                        if listbox == self.installed_app_list:
-                            self.notebook.set_current_page(1)
-                            self.show_app_details(app, self.my_apps_stack, "list")
-                        else:
-                            self.notebook.set_current_page(0)
-                            self.show_app_details(app, self.store_stack, "apps")
-                    else:
-                        print(f"Aplicativo não encontrado: {app_name}")
-                else:
-                    print("Name label not found in row structure")
+        app_name = getattr(row, "app_name", None) if row else None
+        if not app_name:
+            print("Invalid row structure or placeholder row selected")
+            return
+        app = self.apps_by_name.get(app_name)
+        if app:
+            print(f"App selecionado: {app_name}, Detalhes: {app}")
+            if listbox == self.installed_app_list:
+                self.notebook.set_current_page(1)
+                self.load_app_details(app, lambda record: self.show_app_details(record, self.my_apps_stack, "list"))
             else:
-                print("Invalid row structure or placeholder row selected")
+                self.notebook.set_current_page(0)
+                self.load_app_details(app, lambda record: self.show_app_details(record, self.store_stack, "apps"))
+        else:
+            print(f"Aplicativo não encontrado: {app_name}")
 
     def show_app_details(self, app, target_stack, back_view_name):
         """Exibe a visão detalhada do aplicativo."""
-        details_name = f"details_{app['name']}"
+        details_name = f"details_{app.name}"
+        # Imagens ainda na fila da página anterior desta pilha não serão mais exibidas
+        for handle in self.details_fetches.pop(target_stack, ()):
+            if handle:
+                handle.cancel()
+        fetches = self.details_fetches[target_stack] = []
         if target_stack.get_child_by_name(details_name):
             target_stack.remove(target_stack.get_child_by_name(details_name))
 
@@ -849,36 +2730,37 @@ class AppImageShop(Gtk.Window):
         content_grid.set_property("visible", True)
         details_box.pack_start(content_grid, True, True, 0)
 
-        icon = self.get_custom_icon(app)
+        icon = self.get_custom_icon(app, priority=IMAGE_PRIORITY_DETAILS)
+        fetches.append(icon.fetch_handle)
         icon.set_property("visible", True)
         content_grid.attach(icon, 0, 0, 1, 4)
 
-        name_label = Gtk.Label(label=f"<b>{app['name']}</b>", use_markup=True, halign=Gtk.Align.START)
+        name_label = Gtk.Label(label=f"<b>{app.name}</b>", use_markup=True, halign=Gtk.Align.START)
         name_label.get_style_context().add_class("title")
         name_label.set_property("visible", True)
         content_grid.attach(name_label, 1, 0, 1, 1)
 
-        version_label = Gtk.Label(label=f"<b>Versão:</b> {app.get('version', 'N/A')} ({app.get('size', 'N/A')})", use_markup=True, halign=Gtk.Align.START)
+        version_label = Gtk.Label(label=f"<b>Versão:</b> {app.version or 'N/A'} ({app.size or 'N/A'})", use_markup=True, halign=Gtk.Align.START)
         version_label.get_style_context().add_class("details-text")
         version_label.set_property("visible", True)
         content_grid.attach(version_label, 1, 1, 1, 1)
 
-        category_label = Gtk.Label(label=f"<b>Categoria:</b> {app.get('category', 'N/A')}", use_markup=True, halign=Gtk.Align.START)
+        category_label = Gtk.Label(label=f"<b>Categoria:</b> {app.category or 'N/A'}", use_markup=True, halign=Gtk.Align.START)
         category_label.get_style_context().add_class("details-text")
         category_label.set_property("visible", True)
         content_grid.attach(category_label, 1, 2, 1, 1)
 
-        license_label = Gtk.Label(label=f"<b>Licença:</b> {app.get('license', 'N/A')}", use_markup=True, halign=Gtk.Align.START)
+        license_label = Gtk.Label(label=f"<b>Licença:</b> {app.license or 'N/A'}", use_markup=True, halign=Gtk.Align.START)
         license_label.get_style_context().add_class("details-text")
         license_label.set_property("visible", True)
         content_grid.attach(license_label, 1, 3, 1, 1)
 
-        last_updated_label = Gtk.Label(label=f"<b>Última Atualização:</b> {app.get('last_updated', 'N/A')}", use_markup=True, halign=Gtk.Align.START)
+        last_updated_label = Gtk.Label(label=f"<b>Última Atualização:</b> {app.last_updated or 'N/A'}", use_markup=True, halign=Gtk.Align.START)
         last_updated_label.get_style_context().add_class("details-text")
         last_updated_label.set_property("visible", True)
         content_grid.attach(last_updated_label, 1, 4, 1, 1)
 
-        tags_label = Gtk.Label(label=f"<b>Tags:</b> {', '.join(app.get('tags', [])) or 'N/A'}", use_markup=True, halign=Gtk.Align.START)
+        tags_label = Gtk.Label(label=f"<b>Tags:</b> {', '.join(app.tags) or 'N/A'}", use_markup=True, halign=Gtk.Align.START)
         tags_label.get_style_context().add_class("details-text")
         tags_label.set_property("visible", True)
         content_grid.attach(tags_label, 1, 5, 1, 1)
@@ -888,7 +2770,7 @@ class AppImageShop(Gtk.Window):
         description_title.set_property("visible", True)
         content_grid.attach(description_title, 0, 6, 2, 1)
 
-        desc_label = Gtk.Label(label=app.get("details", "Sem descrição disponível"), wrap=True, max_width_chars=80, halign=Gtk.Align.START)
+        desc_label = Gtk.Label(label=app.details or "Sem descrição disponível", wrap=True, max_width_chars=80, halign=Gtk.Align.START)
         desc_label.get_style_context().add_class("details-text")
         desc_label.set_property("visible", True)
         content_grid.attach(desc_label, 0, 7, 2, 1)
@@ -898,12 +2780,13 @@ class AppImageShop(Gtk.Window):
         screenshot_label.set_property("visible", True)
         content_grid.attach(screenshot_label, 0, 8, 2, 1)
 
-        screenshots = app.get("screenshots", [])
+        screenshots = app.screenshots
         if screenshots:
             screenshot_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
             screenshot_box.set_property("visible", True)
             for screenshot in screenshots[:3]:
-                image = self.get_screenshot_image(screenshot, app["name"])
+                image = self.get_screenshot_image(screenshot, app.name)
+                fetches.append(image.fetch_handle)
                 image.set_property("visible", True)
                 caption_label = Gtk.Label(label=screenshot.get("caption", "Sem legenda"), wrap=True, halign=Gtk.Align.CENTER)
                 caption_label.get_style_context().add_class("details-text")
@@ -916,35 +2799,35 @@ class AppImageShop(Gtk.Window):
             screenshot_placeholder.set_property("visible", True)
             content_grid.attach(screenshot_placeholder, 0, 9, 2, 1)
 
-        appimage_path = os.path.join(self.appimage_dir, f"{app['name']}.AppImage")
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10, halign=Gtk.Align.END, margin_end=10, margin_bottom=10)
         button_box.set_property("visible", True)
         details_box.pack_end(button_box, False, False, 0)
 
         version_combo = Gtk.ComboBoxText()
-        version_combo.append_text(f"{app['version']} ({app.get('size', 'N/A')})")
-        for alt_version in app.get("alternative_versions", []):
+        version_combo.append_text(f"{app.version} ({app.size or 'N/A'})")
+        for alt_version in app.alternative_versions:
             version_combo.append_text(f"{alt_version['version']} ({alt_version.get('size', 'N/A')})")
         version_combo.set_active(0)
         version_combo.set_property("visible", True)
         button_box.pack_start(version_combo, False, False, 0)
 
-        self.action_button = Gtk.Button(label="Remover" if os.path.exists(appimage_path) else "Instalar")
-        self.action_button.get_style_context().add_class("destructive-action" if os.path.exists(appimage_path) else "suggested-action")
-        self.action_button.connect("clicked", self.on_action_clicked, app["name"], app.get("appimage_url", ""), os.path.exists(appimage_path), app.get("version"), version_combo)
+        installed = self.is_installed(app.name)
+        self.action_button = Gtk.Button(label="Remover" if installed else "Instalar")
+        self.action_button.get_style_context().add_class("destructive-action" if installed else "suggested-action")
+        self.action_button.connect("clicked", self.on_action_clicked, app.name, app.appimage_url, installed, app.version, version_combo)
         self.action_button.set_property("visible", True)
         button_box.pack_start(self.action_button, False, False, 0)
 
-        if os.path.exists(appimage_path):
+        if installed:
             launch_button = Gtk.Button(label="Iniciar")
             launch_button.get_style_context().add_class("suggested-action")
-            launch_button.connect("clicked", self.on_launch_clicked, app["name"])
+            launch_button.connect("clicked", self.on_launch_clicked, app.name)
             launch_button.set_property("visible", True)
             button_box.pack_start(launch_button, False, False, 0)
 
         target_stack.add_named(details_box, details_name)
         target_stack.set_visible_child_name(details_name)
-        self.header_bar.set_subtitle(f"{app['name']} - Detalhes")
+        self.header_bar.set_subtitle(f"{app.name} - Detalhes")
         details_box.show_all()
 
     def on_launch_clicked(self, button, app_name):
@@ -956,12 +2839,19 @@ class AppImageShop(Gtk.Window):
         except Exception as e:
             self.show_notification(f"Erro ao iniciar {app_name}: {e}")
 
-    def on_action_clicked(self, button, name, url, installed, version, version_combo):
+    def on_action_clicked(self, button, name, url, installed, version, version_combo=None):
         """Manipula clique no botão de instalar/remover."""
-        selected_version = version_combo.get_active_text().split(" (")[0]
-        app = next((a for a in self.apps if a["name"] == name), None)
+        selected_version = version_combo.get_active_text().split(" (")[0] if version_combo else version
+        app = self.apps_by_name.get(name)
+        source = self._source_of(app) if app else None
+        if app and not installed and name not in self.app_details and source and source.shards is not None:
+            # Entrada do índice sem URL de download: carrega o fragmento antes de instalar
+            self.load_app_details(app, lambda record: self.on_action_clicked(
+                button, name, record.appimage_url, installed, version, version_combo))
+            return
+        alternative_versions = self.get_app_record(app).alternative_versions if app else ()
         if selected_version != version:
-            for alt_version in app.get("alternative_versions", []):
+            for alt_version in alternative_versions:
                 if alt_version["version"] == selected_version:
                     url = alt_version["appimage_url"]
                     version = alt_version["version"]
@@ -972,7 +2862,7 @@ class AppImageShop(Gtk.Window):
                                       buttons=Gtk.ButtonsType.YES_NO, text=f"Remover {name}?")
             if dialog.run() == Gtk.ResponseType.YES:
                 button.set_sensitive(False)
-                threading.Thread(target=self._remove_appimage, args=(name, button), daemon=True).start()
+                threading.Thread(target=self._remove_appimage, args=(name,), daemon=True).start()
                 self.store_stack.set_visible_child_name("apps")
                 self.my_apps_stack.set_visible_child_name("list")
                 self.notebook.set_current_page(0)
@@ -990,15 +2880,17 @@ class AppImageShop(Gtk.Window):
                 self.update_download_history(name, self.downloads[name])
                 self.refresh_downloads_list()
                 self.notebook.set_current_page(2)
-                thread = threading.Thread(target=self._download_and_install_appimage, args=(url, name, button, version), daemon=True)
+                thread = threading.Thread(target=self._download_and_install_appimage, args=(url, name, version), daemon=True)
                 thread.cancelled = False
                 self.download_threads[name] = thread
                 thread.start()
             dialog.destroy()
 
-    def _download_and_install_appimage(self, url, name, button, version):
+    def _download_and_install_appimage(self, url, name, version):
         """Baixa e instala um AppImage."""
         appimage_path = os.path.join(self.appimage_dir, f"{name}.AppImage")
+        # Baixado à parte e renomeado ao final: o monitor da pasta só vê o AppImage completo
+        partial_path = f"{appimage_path}.part"
         try:
             def report_hook(block_num, block_size, total_size):
                 if hasattr(self.download_threads[name], 'cancelled') and self.download_threads[name].cancelled:
@@ -1007,17 +2899,19 @@ class AppImageShop(Gtk.Window):
                 status = f"Baixando: {int(fraction * 100)}%" if total_size > 0 else "Baixando..."
                 GLib.idle_add(self._update_download_progress, name, fraction, status)
 
-            urllib.request.urlretrieve(url, appimage_path, reporthook=report_hook)
-            os.chmod(appimage_path, 0o755)
+            urllib.request.urlretrieve(url, partial_path, reporthook=report_hook)
+            os.chmod(partial_path, 0o755)
+            os.replace(partial_path, appimage_path)
 
-            app_data = next(app for app in self.apps if app["name"] == name)
+            app_data = self.get_app_record(self.apps_by_name[name])
+            self._install_icon(app_data)
             desktop_file_content = f"""[Desktop Entry]
 Name={name}
 Exec={appimage_path} %U
 Type=Application
 Icon={os.path.join(self.icon_dir, f"{quote(name)}.png")}
 Terminal=false
-Categories={app_data['app']};
+Categories={app_data.app};
 Comment=Versão: {version}"""
             desktop_path = os.path.expanduser(f"~/.local/share/applications/{name}.desktop")
             with open(desktop_path, 'w') as f:
@@ -1025,15 +2919,32 @@ Comment=Versão: {version}"""
 
             GLib.idle_add(self._update_download_progress, name, 1.0, "Concluído")
             GLib.idle_add(self.show_notification, f"{name} (v{version}) instalado com sucesso!")
-            GLib.idle_add(self.refresh_app_list)
-            GLib.idle_add(self._update_action_button, button, name, True)
+            GLib.idle_add(self.refresh_app_row, name)
+            GLib.idle_add(self._update_action_button, name, True)
             GLib.idle_add(lambda: self.downloads.pop(name, None) and self.download_threads.pop(name, None) and self.refresh_downloads_list())
         except Exception as e:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
             GLib.idle_add(self._update_download_progress, name, 0.0, f"Erro: {str(e)}")
             GLib.idle_add(self.show_notification, f"Erro ao instalar {name}: {str(e)}")
-            GLib.idle_add(self._update_action_button, button, name, False)
+            GLib.idle_add(self._update_action_button, name, False)
             GLib.idle_add(lambda: self.downloads.pop(name, None) and self.download_threads.pop(name, None) and self.refresh_downloads_list())
 
+    def _install_icon(self, app):
+        """Grava o ícone usado pela entrada de desktop, copiando-o do cache de imagens se já estiver lá."""
+        if not app.icon_url:
+            return
+        icon_path = os.path.join(self.icon_dir, f"{quote(app.name)}.png")
+        partial = f"{icon_path}.part"
+        try:
+            try:
+                shutil.copyfile(self.image_cache.path(app.icon_url), partial)
+            except OSError:
+                urllib.request.urlretrieve(app.icon_url, partial)
+            os.replace(partial, icon_path)
+        except Exception as e:
+            print(f"Erro ao salvar ícone de {app.name}: {e}")
+
     def _update_download_progress(self, app_name, fraction, status_text):
         """Atualiza o progresso de download na UI."""
         if app_name in self.downloads:
@@ -1041,19 +2952,23 @@ Comment=Versão: {version}"""
             self.update_download_history(app_name, self.downloads[app_name])
             self.refresh_downloads_list()
 
-    def _update_action_button(self, button, app_name, installed):
-        """Atualiza o estado do botão de instalar/remover."""
-        button.set_sensitive(True)
-        button.set_label("Remover" if installed else "Instalar")
-        button.get_style_context().remove_class("suggested-action")
-        button.get_style_context().remove_class("destructive-action")
-        button.get_style_context().add_class("destructive-action" if installed else "suggested-action")
-        app = next((a for a in self.apps if a["name"] == app_name), None)
+    def _update_action_button(self, app_name, installed):
+        """Atualiza o botão de instalar/remover do aplicativo nas listas e nas páginas de detalhes.
+
+        As linhas são procuradas pelo nome: a linha do clique pode ter sido reaproveitada para outro aplicativo.
+        """
+        for row in (self.app_rows.get(app_name), self.installed_rows.get(app_name)):
+            if row and row.app_name == app_name:
+                row.installed = installed
+                self._set_action_button_state(row.action_button, installed)
+                row.launch_button.set_visible(installed)
+        app = self.apps_by_name.get(app_name)
         if app:
+            app = self.get_app_record(app)
             GLib.idle_add(self.show_app_details, app, self.store_stack, "apps")
             GLib.idle_add(self.show_app_details, app, self.my_apps_stack, "list")
 
-    def _remove_appimage(self, name, button):
+    def _remove_appimage(self, name):
         """Remove um AppImage e sua entrada de desktop."""
         appimage_path = os.path.join(self.appimage_dir, f"{name}.AppImage")
         desktop_path = os.path.expanduser(f"~/.local/share/applications/{name}.desktop")
@@ -1064,11 +2979,11 @@ Comment=Versão: {version}"""
                 if os.path.exists(path):
                     os.remove(path)
             GLib.idle_add(self.show_notification, f"{name} removido com sucesso!")
-            GLib.idle_add(self.refresh_app_list)
-            GLib.idle_add(self._update_action_button, button, name, False)
+            GLib.idle_add(self.refresh_app_row, name)
+            GLib.idle_add(self._update_action_button, name, False)
         except Exception as e:
             GLib.idle_add(self.show_notification, f"Erro ao remover {name}: {e}")
-            GLib.idle_add(self._update_action_button, button, name, os.path.exists(appimage_path))
+            GLib.idle_add(self._update_action_button, name, os.path.exists(appimage_path))
 
     def show_notification(self, message):
         """Exibe uma notificação."""
@@ -1087,15 +3002,23 @@ Comment=Versão: {version}"""
             self.load_apps_from_url()
         dialog.destroy()
 
-    def _create_completion_model(self):
-        """Cria modelo para autocompletar busca."""
-        model = Gtk.ListStore(str)
-        for app in self.apps:
-            model.append([app["name"]])
-            model.append([app["category"]])
-            for tag in app.get("tags", []):
-                model.append([tag])
-        return model
+    def _update_completion(self, text):
+        """Substitui as sugestões do autocompletar pelas melhores para o texto digitado."""
+        self.completion_model.clear()
+        for term in self.completion_index.search(text):
+            self.completion_model.append([term])
+
+    def _build_completion_index(self):
+        """Reconstrói em segundo plano o índice de autocompletar a partir do catálogo exibido."""
+        apps, count = self.apps, len(self.apps)
+
+        def apply(index):
+            if apps is self.apps and len(apps) == count:
+                self.completion_index = index
+            else:
+                self._build_completion_index()  # O catálogo mudou durante a construção
+
+        threading.Thread(target=lambda: GLib.idle_add(apply, CompletionIndex(apps[:count])), daemon=True).start()
 
 def main():
     app = AppImageShop()